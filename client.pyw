@@ -1,8 +1,9 @@
-import sys,win32event,win32api
+import sys,os,win32file,win32con,pywintypes
 from PyQt5.QtWidgets import*
 from PyQt5.QtGui import QIcon
-m=win32event.CreateMutex(None,1,'multiclient_singletonMutex')
-if win32api.GetLastError()==183:sys.exit()
+l=win32file.CreateFile(os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'),'multiclient.lock'),win32con.GENERIC_READ|win32con.GENERIC_WRITE,win32con.FILE_SHARE_READ|win32con.FILE_SHARE_WRITE,None,win32con.OPEN_ALWAYS,win32con.FILE_ATTRIBUTE_NORMAL,None)
+try:win32file.LockFileEx(l,win32con.LOCKFILE_EXCLUSIVE_LOCK|win32con.LOCKFILE_FAIL_IMMEDIATELY,1,0,pywintypes.OVERLAPPED())
+except pywintypes.error:sys.exit()
 a=QApplication([])
 a.setQuitOnLastWindowClosed(False)
 if not QSystemTrayIcon.isSystemTrayAvailable():sys.exit()
@@ -6,7 +6,7 @@ A comprehensive debugging version of the multiclient system tray application
 with extensive logging, dark theme UI, and detailed control capabilities.
 
 Features:
-- Singleton application using Windows mutex
+- Singleton application using an exclusive Windows lock file
 - System tray integration with context menu
 - Real-time logging of all events and actions
 - Control panel for application management
@@ -17,14 +17,301 @@ Author: Generated for debugging purposes
 """
 
 import sys
-import win32event
-import win32api
+import win32file
+import win32con
+import pywintypes
+import winerror
 from PyQt5.QtWidgets import *
-from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
-from PyQt5.QtCore import QTimer, QDateTime, pyqtSignal, QObject, Qt
+from PyQt5.QtGui import QIcon, QFont, QPalette, QColor, QBrush, QTextCursor, QTextCharFormat
+from PyQt5.QtCore import QTimer, QDateTime, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QObject, Qt, QRect
+from collections import deque
+from functools import partial
 import traceback
+import threading
+import textwrap
+import atexit
+import queue
+import time
 import os
 
+try:
+    import psutil  # Optional - enables real memory usage reporting
+except ImportError:
+    psutil = None
+
+
+# =============================================================================
+# CONFIGURATION CONSTANTS
+# =============================================================================
+
+# Maximum number of log lines kept in the log display. Older lines are dropped
+# from the top once the limit is reached. Each block costs layout time and
+# memory, so keep this close to what a user will actually scroll through
+# (Dolphin's log widget rewrite settled on a similar bound).
+MAXIMUM_BLOCK_COUNT = 2000
+
+# Step-by-step SYSTEM logging during startup and while building the UI is
+# overhead that is only useful when debugging the debug tool itself. Set
+# MULTICLIENT_VERBOSE=1 to enable it.
+DEBUG_VERBOSE = os.environ.get("MULTICLIENT_VERBOSE") == "1"
+
+# Console output is off by default - writing to the Windows console is slow
+# and nobody is usually watching it. Set MULTICLIENT_CONSOLE=1 to enable.
+# While it is off, ERROR lines are still written to stderr.
+CONSOLE_ENABLED = os.environ.get("MULTICLIENT_CONSOLE") == "1"
+
+# Log level names. Interned once so every call site passes the same string
+# object and level lookups can hit the identity fast path.
+_LVL_INFO = sys.intern("INFO")
+_LVL_ERROR = sys.intern("ERROR")
+_LVL_WARNING = sys.intern("WARNING")
+_LVL_ACTION = sys.intern("ACTION")
+_LVL_EVENT = sys.intern("EVENT")
+_LVL_SYSTEM = sys.intern("SYSTEM")
+
+# Console lines are written by a background thread. Lines are dropped rather
+# than blocking the GUI thread if more than CONSOLE_QUEUE_SIZE are waiting.
+CONSOLE_QUEUE_SIZE = 8192
+
+# Maximum number of lines joined into a single console write
+CONSOLE_BATCH_SIZE = 256
+
+# Seconds the console writer waits to gather a batch before writing it.
+# Levels in CONSOLE_URGENT_LEVELS are written out immediately instead.
+CONSOLE_FLUSH_INTERVAL = 0.25
+CONSOLE_URGENT_LEVELS = (_LVL_ERROR, _LVL_WARNING)
+
+# Per-user folder for the instance lock file and the tray check flag file
+_APP_DATA_DIR = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+
+# A successful system tray check is remembered (as the mtime of a flag file)
+# for this many seconds, so quick restarts skip the shell probe
+TRAY_CHECK_CACHE_SECONDS = 3600
+
+# Application start time (monotonic). Windows are created on demand, so
+# uptime is measured from import rather than from window construction.
+_APP_START_MONOTONIC = time.monotonic()
+
+# (message, level) pairs logged by the control panel's "Generate Test Logs"
+_TEST_MESSAGES = (
+    ("Test INFO message - Application checkpoint", _LVL_INFO),
+    ("Test WARNING message - Minor issue detected", _LVL_WARNING),
+    ("Test ERROR message - Simulated error condition", _LVL_ERROR),
+    ("Test ACTION message - User performed action", _LVL_ACTION),
+    ("Test EVENT message - System event occurred", _LVL_EVENT),
+    ("Test SYSTEM message - Internal system operation", _LVL_SYSTEM),
+)
+
+# (message, level) pairs logged by the tray menu's "Generate Test Logs",
+# ending with the completion notice so the whole batch is one call
+_QUICK_TEST_MESSAGES = (
+    ("Quick test: Application status check (1/4)", _LVL_ACTION),
+    ("Quick test: Memory usage verification (2/4)", _LVL_EVENT),
+    ("Quick test: Network connectivity check (3/4)", _LVL_SYSTEM),
+    ("Quick test: File system access verification (4/4)", _LVL_INFO),
+    ("Quick test log generation completed", _LVL_ACTION),
+)
+
+
+# =============================================================================
+# STYLESHEETS
+# =============================================================================
+
+# Dark theme for the log window, built once at import
+LOG_WINDOW_STYLESHEET = textwrap.dedent("""
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    
+    QPlainTextEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        color: #ffffff;
+        selection-background-color: #404040;
+    }
+    
+    QPushButton {
+        background-color: #404040;
+        border: 2px solid #606060;
+        border-radius: 6px;
+        padding: 8px 16px;
+        color: #ffffff;
+        font-weight: bold;
+        min-width: 100px;
+    }
+    
+    QPushButton:hover {
+        background-color: #505050;
+        border-color: #707070;
+    }
+    
+    QPushButton:pressed {
+        background-color: #353535;
+    }
+    
+    QComboBox {
+        background-color: #404040;
+        border: 2px solid #606060;
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: #ffffff;
+        min-width: 80px;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border: 2px solid #ffffff;
+        width: 6px;
+        height: 6px;
+    }
+    
+    QCheckBox {
+        color: #ffffff;
+        spacing: 8px;
+    }
+    
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        background-color: #404040;
+        border: 2px solid #606060;
+        border-radius: 3px;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #106ebe;
+    }
+    
+    QLabel {
+        color: #ffffff;
+    }
+""")
+
+# Dark theme for the control window and its dialogs, built once at import
+CONTROL_WINDOW_STYLESHEET = textwrap.dedent("""
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    
+    QGroupBox {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 8px;
+        padding-top: 12px;
+        font-weight: bold;
+        font-size: 13px;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: #ffffff;
+    }
+    
+    QPushButton {
+        background-color: #404040;
+        border: 2px solid #606060;
+        border-radius: 6px;
+        padding: 10px 16px;
+        color: #ffffff;
+        font-weight: bold;
+        min-height: 20px;
+    }
+    
+    QPushButton:hover {
+        background-color: #505050;
+        border-color: #707070;
+    }
+    
+    QPushButton:pressed {
+        background-color: #353535;
+    }
+    
+    QCheckBox {
+        color: #ffffff;
+        spacing: 8px;
+        font-size: 12px;
+    }
+    
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        background-color: #404040;
+        border: 2px solid #606060;
+        border-radius: 4px;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #106ebe;
+    }
+    
+    QCheckBox::indicator:checked:hover {
+        background-color: #106ebe;
+    }
+    
+    QLabel {
+        color: #ffffff;
+    }
+""")
+
+
+# =============================================================================
+# UPTIME - Shared by the tray menu and the control window
+# =============================================================================
+
+class _UptimeClock:
+    """
+    Formats the application uptime as HH:MM:SS.
+    
+    The text is reused while the whole seconds are unchanged, so callers
+    polling it every tick only format it once per second.
+    """
+    
+    def __init__(self, start_monotonic):
+        """
+        Initialize the clock.
+        
+        Args:
+            start_monotonic (float): time.monotonic() value uptime counts from
+        """
+        self.start_monotonic = start_monotonic
+        self.cached_seconds = -1
+        self.cached_text = ""
+        
+    def text(self):
+        """
+        Get the current uptime as text.
+        
+        Returns:
+            str: Formatted uptime string (HH:MM:SS)
+        """
+        uptime_seconds = int(time.monotonic() - self.start_monotonic)
+        if uptime_seconds != self.cached_seconds:
+            hours, remainder = divmod(uptime_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self.cached_seconds = uptime_seconds
+            self.cached_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return self.cached_text
+
+
+# Application uptime, available before any window exists
+_APP_UPTIME = _UptimeClock(_APP_START_MONOTONIC)
+
 
 # =============================================================================
 # LOGGER CLASS - Handles all application logging
@@ -35,50 +322,287 @@ class Logger(QObject):
     Custom logger class that handles all application logging.
     
     This class provides centralized logging functionality with different log levels
-    and emits Qt signals to update the GUI in real-time. All log messages are
-    timestamped and formatted consistently.
+    and passes each entry to subscribed callbacks to update the GUI in real-time.
+    All log messages are timestamped and formatted consistently.
     
     Signals:
-        log_signal: Emitted when a new log entry is created
+        log_signal: Carries (level, formatted message) to the GUI thread when
+            log() is called from another thread
     """
     
-    # Qt signal that carries log messages to GUI components
-    log_signal = pyqtSignal(str)
+    # Qt signal used only to hand entries logged from background threads over
+    # to the GUI thread. Same-thread entries are delivered to subscribers
+    # directly, without going through Qt's signal dispatch.
+    log_signal = pyqtSignal(str, str)
     
     def __init__(self):
         """Initialize the logger object."""
         super().__init__()
-        self.log("Logger initialized", "SYSTEM")
         
-    def log(self, message, level="INFO"):
+        # Callbacks taking (level, formatted message), called for each entry
+        self._subscribers = []
+        
+        # Entries logged while nobody is subscribed (the log window is built
+        # on demand), replayed by attach_sink(). deque.append is atomic, so
+        # background threads can add to it without a lock.
+        self._pending = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        
+        # log() calls from other threads are queued over to this thread
+        self._owner_thread = threading.get_ident()
+        self.log_signal.connect(self._dispatch)
+        
+        # Timestamp text up to the whole second, rebuilt once per second
+        self._cached_sec = 0
+        self._cached_prefix = ""
+        
+        # Console mirroring (stdout is None when running under pythonw)
+        self.console_enabled = CONSOLE_ENABLED and sys.stdout is not None
+        
+        if self.console_enabled:
+            # Console writes happen on a daemon thread so a slow console
+            # never blocks the thread calling log()
+            self._console_queue = queue.Queue(maxsize=CONSOLE_QUEUE_SIZE)
+            self._console_thread = threading.Thread(
+                target=self._console_worker, name="LoggerConsole", daemon=True
+            )
+            self._console_thread.start()
+            
+            # Write out whatever is still queued when the interpreter exits
+            atexit.register(self.flush_console)
+            
+        self.log("Logger initialized", _LVL_SYSTEM)
+        
+    def log(self, message, level=_LVL_INFO):
         """
         Log a message with specified level.
         
         Args:
-            message (str): The message to log
+            message (str): The message to log (other objects, such as
+                structured dicts, are formatted with str())
             level (str): Log level (INFO, ERROR, WARNING, ACTION, EVENT, SYSTEM)
         """
-        # Create timestamp with millisecond precision
-        timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss.zzz")
+        prefix, millis = self._timestamp()
         
-        # Format the complete log message
-        formatted_message = f"[{timestamp}] [{level:8}] {message}"
+        # Format the complete log message (%-formatting is a single C call)
+        self._deliver(level, "[%s%03d] [%-8s] %s" % (prefix, millis, level, message))
         
-        # Emit signal for GUI updates (if connected)
-        self.log_signal.emit(formatted_message)
+    def log_many(self, entries):
+        """
+        Log several messages at once, sharing a single timestamp.
+        
+        Args:
+            entries (iterable): (message, level) pairs to log in order
+        """
+        prefix, millis = self._timestamp()
+        for message, level in entries:
+            self._deliver(level, "[%s%03d] [%-8s] %s" % (prefix, millis, level, message))
+            
+    def log_exception(self, label, level=_LVL_ERROR):
+        """
+        Log the exception currently being handled, with its traceback.
+        
+        Meant to be called from an except block (like logging's
+        Logger.exception); the traceback is only formatted here, so
+        handlers that never reach this pay nothing for it. Without a
+        console the traceback always goes to stderr, whatever the level,
+        since the caller may be about to exit before any window shows it.
         
-        # Also print to console for backup/debugging
-        print(formatted_message)
+        Args:
+            label (str): Short description of what failed
+            level (str): Log level to use
+        """
+        exc_type, exc, tb = sys.exc_info()
+        if exc is None:
+            self.log(label, level)
+            return
+        details = "".join(traceback.format_exception(exc_type, exc, tb))
+        self.log("%s: %s\n%s" % (label, exc, details), level)
+        
+        # ERROR lines already reach stderr (or the console) through _deliver
+        if level != _LVL_ERROR and not self.console_enabled and sys.stderr is not None:
+            sys.stderr.write("%s: %s\n%s" % (label, exc, details))
+            sys.stderr.flush()
+        
+    def _timestamp(self):
+        """
+        Get the current time for a log line.
         
-        # Log critical errors to system as well
-        if level == "ERROR":
-            print(f"CRITICAL: {message}", file=sys.stderr)
+        The formatted date/time part is reused while still within the same
+        second, so only the millisecond tail changes per call.
+        
+        Returns:
+            tuple: (date/time prefix ending in ".", milliseconds)
+        """
+        now = time.time()
+        sec = int(now)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_prefix = time.strftime("%Y-%m-%d %H:%M:%S.", time.localtime(sec))
+        return self._cached_prefix, int((now - sec) * 1000)
+        
+    def _deliver(self, level, formatted_message):
+        """
+        Hand a formatted log line to the subscribers and console.
+        
+        Args:
+            level (str): Log level of the line
+            formatted_message (str): The complete formatted log line
+        """
+        # Notify subscribers for GUI updates, or keep the line for later
+        if self._subscribers:
+            if threading.get_ident() == self._owner_thread:
+                self._dispatch(level, formatted_message)
+            else:
+                self.log_signal.emit(level, formatted_message)
+        else:
+            self._pending.append((level, formatted_message))
+        
+        # Also hand off to the console writer for backup/debugging if enabled
+        if self.console_enabled:
+            try:
+                self._console_queue.put_nowait(
+                    (formatted_message, level in CONSOLE_URGENT_LEVELS)
+                )
+            except queue.Full:
+                pass  # Console can't keep up - drop rather than block
+        elif level == _LVL_ERROR and sys.stderr is not None:
+            # No console - errors still go to stderr (None under pythonw),
+            # the only place a fatal error shows before any window exists
+            sys.stderr.write("CRITICAL: %s\n" % formatted_message)
+            sys.stderr.flush()
+                
+    def subscribe(self, callback):
+        """
+        Register a callback to receive every new log entry.
+        
+        Args:
+            callback (callable): Called with (level, formatted message)
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+            
+    def attach_sink(self, callback):
+        """
+        Subscribe a callback and replay the entries logged before it.
+        
+        Everything logged while there were no subscribers (e.g. the whole
+        startup sequence) is delivered to the callback first, in order.
+        Must be called from the thread that created the logger.
+        
+        Args:
+            callback (callable): Called with (level, formatted message)
+        """
+        pending = self._pending
+        while pending:
+            level, formatted_message = pending.popleft()
+            callback(level, formatted_message)
+        self.subscribe(callback)
+        
+    def unsubscribe(self, callback):
+        """
+        Stop delivering log entries to a callback.
+        
+        Args:
+            callback (callable): A callback previously passed to subscribe()
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+            
+    @pyqtSlot(str, str)
+    def _dispatch(self, level, formatted_message):
+        """Deliver a log entry to all subscribers."""
+        for callback in self._subscribers:
+            callback(level, formatted_message)
+            
+    def _console_worker(self):
+        """
+        Background thread loop that writes queued lines to the console.
+        
+        Lines are gathered for up to CONSOLE_FLUSH_INTERVAL seconds (or
+        CONSOLE_BATCH_SIZE lines) and written in one call, so a burst of
+        log calls - e.g. while windows are being built - costs a single
+        console write. An urgent line ends the batch straight away.
+        """
+        while True:
+            # Block until there is at least one line
+            line, urgent = self._console_queue.get()
+            if line is None:
+                return  # Stop requested by flush_console()
+            batch = [line]
+            stop = False
+            deadline = time.monotonic() + CONSOLE_FLUSH_INTERVAL
+            
+            while not urgent and len(batch) < CONSOLE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    line, urgent = self._console_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                batch.append(line)
+                
+            self._write_console_batch(batch)
+            if stop:
+                return
+            
+    def _write_console_batch(self, batch):
+        """
+        Write a batch of lines to the console in one call.
+        
+        Args:
+            batch (list): Formatted lines to write
+        """
+        sys.stdout.write("\n".join(batch) + "\n")
+        sys.stdout.flush()
+        
+    def flush_console(self):
+        """
+        Stop the console writer once it has written every queued line.
+        
+        Called at interpreter exit. A stop marker is queued behind the
+        remaining lines and the writer thread is waited for, so the batch
+        it is still gathering is written too and nothing else writes to
+        the console at the same time.
+        """
+        if not self._console_thread.is_alive():
+            return
+            
+        # Lines logged after this point would have no writer
+        self.console_enabled = False
+        
+        try:
+            self._console_queue.put((None, True), timeout=1.0)
+        except queue.Full:
+            return  # Writer is stuck - don't hold up exit
+        self._console_thread.join(timeout=2.0)
 
 
 # =============================================================================
 # LOG WINDOW CLASS - Displays all application events
 # =============================================================================
 
+def _make_level_format(color, bold=False):
+    """
+    Build the character format used to display one log level.
+    
+    Args:
+        color (str): Text color as a hex string
+        bold (bool): Whether the text is bold
+        
+    Returns:
+        QTextCharFormat: The format to insert log text with
+    """
+    char_format = QTextCharFormat()
+    char_format.setForeground(QBrush(QColor(color)))
+    if bold:
+        char_format.setFontWeight(QFont.Bold)
+    return char_format
+
+
 class LogWindow(QWidget):
     """
     Debug log window that displays all application events in real-time.
@@ -87,6 +611,18 @@ class LogWindow(QWidget):
     application, with features for log management and export functionality.
     """
     
+    # Character format for each log level's color coding. Entries are
+    # inserted as plain text with these formats, so no HTML is parsed.
+    _LEVEL_FORMATS = {
+        _LVL_ERROR: _make_level_format("#ff6b6b", bold=True),
+        _LVL_WARNING: _make_level_format("#ffd93d", bold=True),
+        _LVL_ACTION: _make_level_format("#6bcf7f"),
+        _LVL_EVENT: _make_level_format("#74c0fc"),
+        _LVL_SYSTEM: _make_level_format("#da77f2"),
+    }
+    # INFO and others
+    _DEFAULT_FORMAT = _make_level_format("#ffffff")
+    
     def __init__(self, logger):
         """
         Initialize the log window.
@@ -98,8 +634,22 @@ class LogWindow(QWidget):
         self.logger = logger
         self.log_entry_count = 0  # Track number of log entries for statistics
         
+        # Every retained (level, message) entry - the display is a view of
+        # this buffer, which filtering and saving work from directly
+        self._entries = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        self._filter_level = "ALL"
+        
+        # Messages waiting to be written to the display
+        self._pending = deque(maxlen=MAXIMUM_BLOCK_COUNT)
+        
+        # Coalesce bursts of messages into one display update every 30ms
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(30)
+        self._flush_timer.timeout.connect(self.flush_pending_entries)
+        
         # Log the creation of this window
-        self.logger.log("Initializing Log Window", "SYSTEM")
+        self.logger.log("Initializing Log Window", _LVL_SYSTEM)
         
         # Setup the user interface
         self.init_ui()
@@ -107,11 +657,12 @@ class LogWindow(QWidget):
         # Apply dark theme styling
         self.apply_dark_theme()
         
-        self.logger.log("Log Window initialized successfully", "SYSTEM")
+        self.logger.log("Log Window initialized successfully", _LVL_SYSTEM)
         
     def init_ui(self):
         """Initialize the user interface components."""
-        self.logger.log("Setting up Log Window UI components", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Setting up Log Window UI components", _LVL_SYSTEM)
         
         # Window configuration
         self.setWindowTitle("Multiclient - Debug Log [DARK MODE]")
@@ -156,9 +707,12 @@ class LogWindow(QWidget):
         main_layout.addLayout(stats_layout)
         
         # === LOG DISPLAY AREA ===
-        self.logger.log("Creating log text display area", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Creating log text display area", _LVL_SYSTEM)
         
-        self.log_text = QTextEdit()
+        # QPlainTextEdit is Qt's recommended widget for log viewers: it uses a
+        # flat block layout, so appending a line doesn't reflow the document
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)  # Prevent accidental editing
         
         # Configure font for better readability
@@ -166,13 +720,18 @@ class LogWindow(QWidget):
         log_font.setStyleHint(QFont.TypeWriter)
         self.log_text.setFont(log_font)
         
-        # Set maximum block count to prevent memory issues with large logs
-        self.log_text.document().setMaximumBlockCount(10000)
+        # Limit retained lines to prevent memory issues with large logs
+        self.log_text.document().setMaximumBlockCount(MAXIMUM_BLOCK_COUNT)
+        
+        # Cursor kept at the end of the document for inserting new entries
+        self._cursor = QTextCursor(self.log_text.document())
+        self._cursor.movePosition(QTextCursor.End)
         
         main_layout.addWidget(self.log_text)
         
         # === CONTROL BUTTONS SECTION ===
-        self.logger.log("Creating log window control buttons", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Creating log window control buttons", _LVL_SYSTEM)
         
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
@@ -198,7 +757,7 @@ class LogWindow(QWidget):
         # Filter controls
         button_layout.addWidget(QLabel("Filter:"))
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["ALL", "ERROR", "WARNING", "INFO", "ACTION", "EVENT", "SYSTEM"])
+        self.filter_combo.addItems(["ALL", _LVL_ERROR, _LVL_WARNING, _LVL_INFO, _LVL_ACTION, _LVL_EVENT, _LVL_SYSTEM])
         self.filter_combo.setToolTip("Filter log entries by level")
         self.filter_combo.currentTextChanged.connect(self.apply_log_filter)
         button_layout.addWidget(self.filter_combo)
@@ -211,140 +770,94 @@ class LogWindow(QWidget):
         # Apply the main layout
         self.setLayout(main_layout)
         
-        # === CONNECT LOGGER SIGNALS ===
-        self.logger.log_signal.connect(self.add_log_entry)
-        self.logger.log("Log Window UI setup completed", "SYSTEM")
+        # === SUBSCRIBE TO LOGGER ===
+        # (also picks up everything logged before this window existed)
+        self.logger.attach_sink(self.add_log_entry)
+        if DEBUG_VERBOSE:
+            self.logger.log("Log Window UI setup completed", _LVL_SYSTEM)
         
     def apply_dark_theme(self):
         """Apply dark theme styling to the log window."""
-        self.logger.log("Applying dark theme to Log Window", "SYSTEM")
-        
-        # Main window dark theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                color: #ffffff;
-                selection-background-color: #404040;
-            }
-            
-            QPushButton {
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: #ffffff;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #707070;
-            }
-            
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            
-            QComboBox {
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #ffffff;
-                min-width: 80px;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border: 2px solid #ffffff;
-                width: 6px;
-                height: 6px;
-            }
-            
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 3px;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #106ebe;
-            }
-            
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        if DEBUG_VERBOSE:
+            self.logger.log("Applying dark theme to Log Window", _LVL_SYSTEM)
+        
+        self.setStyleSheet(LOG_WINDOW_STYLESHEET)
         
-    def add_log_entry(self, message):
+    def add_log_entry(self, level, message):
         """
         Add a new log entry to the display.
         
         Args:
+            level (str): Log level of the entry
             message (str): The formatted log message to add
         """
         # Increment entry counter
         self.log_entry_count += 1
-        self.entry_count_label.setText(f"Entries: {self.log_entry_count}")
         
-        # Color-code messages based on log level
-        colored_message = self.colorize_log_message(message)
+        # Queue the message; the display is updated in batches by the flush
+        # timer. Nobody can see the display while hidden, so in that case
+        # the queue is only flushed once the window is shown again.
+        self._entries.append((level, message))
+        self._pending.append((level, message))
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    @pyqtSlot()
+    def flush_pending_entries(self):
+        """Write all queued entries to the display in one batch."""
+        if not self._pending:
+            return
+            
+        self.render_entries(self._pending)
+        self._pending.clear()
         
-        # Add the message to the display
-        self.log_text.append(colored_message)
+    def render_entries(self, entries):
+        """
+        Append entries matching the current filter to the display.
+        
+        Args:
+            entries (iterable): (level, message) tuples to render
+        """
+        # Suppress repaints until the whole batch is in
+        self.log_text.setUpdatesEnabled(False)
+        
+        # Re-anchor in case the document was cleared or trimmed
+        cursor = self._cursor
+        cursor.movePosition(QTextCursor.End)
+        
+        # A single edit block means the document is laid out only once
+        cursor.beginEditBlock()
+        for level, message in entries:
+            if not self.matches_filter(level):
+                continue
+            if not self.log_text.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(message, self.get_level_format(level))
+        cursor.endEditBlock()
+        
+        self.log_text.setUpdatesEnabled(True)
+        
+        # The counter label is only refreshed once per batch, not per entry
+        self.entry_count_label.setText("Entries: " + str(self.log_entry_count))
         
         # Auto-scroll to bottom if enabled
         if self.autoscroll_cb.isChecked():
             scrollbar = self.log_text.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
             
-    def colorize_log_message(self, message):
+    def get_level_format(self, level):
         """
-        Apply color coding to log messages based on their level.
+        Get the color coding for log messages of a level.
         
         Args:
-            message (str): The log message to colorize
+            level (str): Log level of the message
             
         Returns:
-            str: HTML-formatted message with color coding
-        """
-        # Define color scheme for different log levels
-        if "[ERROR   ]" in message:
-            return f'<span style="color: #ff6b6b; font-weight: bold;">{message}</span>'
-        elif "[WARNING ]" in message:
-            return f'<span style="color: #ffd93d; font-weight: bold;">{message}</span>'
-        elif "[ACTION  ]" in message:
-            return f'<span style="color: #6bcf7f;">{message}</span>'
-        elif "[EVENT   ]" in message:
-            return f'<span style="color: #74c0fc;">{message}</span>'
-        elif "[SYSTEM  ]" in message:
-            return f'<span style="color: #da77f2;">{message}</span>'
-        else:  # INFO and others
-            return f'<span style="color: #ffffff;">{message}</span>'
+            QTextCharFormat: Cached character format for the level
+        """
+        return self._LEVEL_FORMATS.get(level, self._DEFAULT_FORMAT)
             
+    @pyqtSlot(str)
     def apply_log_filter(self, filter_level):
         """
         Apply filtering to log display based on selected level.
@@ -352,24 +865,43 @@ class LogWindow(QWidget):
         Args:
             filter_level (str): The log level to filter by ("ALL" shows everything)
         """
-        self.logger.log(f"Applying log filter: {filter_level}", "ACTION")
+        self.logger.log(f"Applying log filter: {filter_level}", _LVL_ACTION)
+        self._filter_level = filter_level
         
-        # This is a simplified implementation - in a full version you'd
-        # maintain separate storage and filter the display accordingly
-        if filter_level == "ALL":
-            self.log_text.setPlainText(self.log_text.toPlainText())  # Refresh display
+        # Rebuild the display from the entry buffer using the stored levels,
+        # in one edit block. Everything pending is also in the buffer, so it
+        # is rendered here as well.
+        self._pending.clear()
+        self.log_text.clear()
+        self.render_entries(self._entries)
+        
+    def matches_filter(self, level):
+        """
+        Check whether entries of a level are shown under the current filter.
         
+        Args:
+            level (str): Log level of the entry
+            
+        Returns:
+            bool: True if the entry should be displayed
+        """
+        return self._filter_level == "ALL" or level == self._filter_level
+        
+    @pyqtSlot()
     def clear_log(self):
         """Clear all log entries from the display."""
-        self.logger.log("User requested log clear", "ACTION")
+        self.logger.log("User requested log clear", _LVL_ACTION)
         self.log_text.clear()
+        self._entries.clear()
+        self._pending.clear()
         self.log_entry_count = 0
         self.entry_count_label.setText("Entries: 0")
-        self.logger.log("Log display cleared", "ACTION")
+        self.logger.log("Log display cleared", _LVL_ACTION)
         
+    @pyqtSlot()
     def save_log(self):
         """Save the current log to a text file."""
-        self.logger.log("User requested log save", "ACTION")
+        self.logger.log("User requested log save", _LVL_ACTION)
         
         try:
             # Generate default filename with timestamp
@@ -385,8 +917,8 @@ class LogWindow(QWidget):
             )
             
             if filename:
-                # Write log content to file
-                with open(filename, 'w', encoding='utf-8') as f:
+                # Write log content to file through a 1 MiB buffer
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     # Add header information
                     f.write("Multiclient Debug Log\n")
                     f.write("=" * 50 + "\n")
@@ -394,30 +926,151 @@ class LogWindow(QWidget):
                     f.write(f"Total Entries: {self.log_entry_count}\n")
                     f.write("=" * 50 + "\n\n")
                     
-                    # Write actual log content (plain text, no HTML)
-                    f.write(self.log_text.toPlainText())
+                    # Stream actual log content from the entry buffer line by
+                    # line (plain text, no HTML, unaffected by the display filter)
+                    for _, message in self._entries:
+                        f.write(message)
+                        f.write("\n")
                     
-                self.logger.log(f"Log saved successfully to: {filename}", "ACTION")
+                self.logger.log(f"Log saved successfully to: {filename}", _LVL_ACTION)
                 
                 # Show success message
                 QMessageBox.information(self, "Save Successful", 
                                       f"Log saved to:\n{filename}")
             else:
-                self.logger.log("Log save cancelled by user", "ACTION")
+                self.logger.log("Log save cancelled by user", _LVL_ACTION)
                 
         except Exception as e:
             error_msg = f"Error saving log file: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             QMessageBox.critical(self, "Save Error", error_msg)
             
+    def showEvent(self, event):
+        """Handle window show event by catching up on buffered entries."""
+        super().showEvent(event)
+        self.flush_pending_entries()
+        
     def closeEvent(self, event):
         """Handle window close event."""
-        self.logger.log("Log Window close requested", "EVENT")
+        self.logger.log("Log Window close requested", _LVL_EVENT)
         # Hide instead of closing to keep it available
         self.hide()
         event.ignore()
 
 
+# =============================================================================
+# SYSTEM INFO TASK - Assembles the system information report off the GUI thread
+# =============================================================================
+
+class SystemInfoSignals(QObject):
+    """
+    Signals for SystemInfoTask (QRunnable cannot define signals itself).
+    
+    Signals:
+        finished: Emitted with the complete report text
+        failed: Emitted with an error message if gathering failed
+    """
+    
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class SystemInfoTask(QRunnable):
+    """
+    Background task that gathers process information and builds the report.
+    
+    Values owned by the GUI (status flags, counters, tray state) are
+    captured by the caller and passed in, so the task only touches
+    thread-safe process information - including os.getcwd(), which can
+    block on a slow or locked file system.
+    """
+    
+    def __init__(self, status):
+        """
+        Initialize the task.
+        
+        Args:
+            status (dict): GUI-side values for the report (monitoring,
+                detailed_logging, tray_visible, uptime, event_count,
+                tray_interaction_count)
+        """
+        super().__init__()
+        self.status = status
+        self.signals = SystemInfoSignals()
+        
+    def run(self):
+        """Build the report and emit it back to the GUI thread."""
+        try:
+            status = self.status
+            info_text = f"""System Information
+{'=' * 50}
+
+Application Details:
+- Name: Multiclient Debug Version
+- Version: 1.0.0
+- Python Version: {sys.version}
+- PyQt5 Version: Available
+- Platform: {sys.platform}
+
+Current Status:
+- Monitoring: {'Enabled' if status['monitoring'] else 'Disabled'}
+- Detailed Logging: {'Enabled' if status['detailed_logging'] else 'Disabled'}
+- Tray Icon: {'Visible' if status['tray_visible'] else 'Hidden'}
+- Uptime: {status['uptime']}
+
+Statistics:
+- Events Logged: {status['event_count']}
+- Tray Interactions: {status['tray_interaction_count']}
+
+Process Information:
+- Process ID: {os.getpid()}
+- Working Directory: {os.getcwd()}
+"""
+            self.signals.finished.emit(info_text)
+            
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class ProcessPrefetchTask(QRunnable):
+    """
+    Background task that prepares process resources during startup.
+    
+    Opening the psutil process handle and taking the first memory sample
+    is done here, overlapping with the GUI-thread tray setup, so the
+    control window can take the ready handle when it is first built.
+    """
+    
+    def __init__(self):
+        """Initialize the task."""
+        super().__init__()
+        self.setAutoDelete(False)  # Result is read after run() finishes
+        self._done = threading.Event()
+        self._proc = None
+        
+    def run(self):
+        """Open the process handle and warm it up."""
+        try:
+            if psutil is not None:
+                proc = psutil.Process()
+                proc.memory_info()
+                self._proc = proc
+        except Exception:
+            pass  # The control window falls back to opening its own handle
+        finally:
+            self._done.set()
+            
+    def result(self):
+        """
+        Wait for the task to finish and get its result.
+        
+        Returns:
+            psutil.Process: The process handle, or None if unavailable
+        """
+        self._done.wait()
+        return self._proc
+
+
 # =============================================================================
 # CONTROL WINDOW CLASS - Application management interface
 # =============================================================================
@@ -430,7 +1083,13 @@ class ControlWindow(QWidget):
     including monitoring toggles, statistics, and management functions.
     """
     
-    def __init__(self, app, tray_icon, logger):
+    # Per-state label styles, shared rather than rebuilt on every toggle
+    _STATUS_QSS_GREEN = "color: #6bcf7f; font-weight: bold; font-size: 14px;"
+    _STATUS_QSS_YELLOW = "color: #ffd93d; font-weight: bold; font-size: 14px;"
+    _TRAY_QSS_GREEN = "color: #6bcf7f; font-size: 12px;"
+    _TRAY_QSS_RED = "color: #ff6b6b; font-size: 12px;"
+    
+    def __init__(self, app, tray_icon, logger, tray_interaction_count=0, proc=None):
         """
         Initialize the control window.
         
@@ -438,6 +1097,9 @@ class ControlWindow(QWidget):
             app (QApplication): The main application instance
             tray_icon (QSystemTrayIcon): The system tray icon instance
             logger (Logger): The logger instance
+            tray_interaction_count (int): Tray interactions so far
+            proc (psutil.Process): Prefetched process handle, or None to
+                open one here
         """
         super().__init__()
         
@@ -450,7 +1112,35 @@ class ControlWindow(QWidget):
         self.monitoring_enabled = True
         self.detailed_logging = True
         
-        self.logger.log("Initializing Control Window", "SYSTEM")
+        # Last uptime text shown, so the label is only touched on change
+        self._last_uptime_str = ""
+        
+        # Tray clicks counted so far (the tray counts them before this
+        # window exists and passes the total in)
+        self.tray_interaction_count = tray_interaction_count
+        
+        # System information dialog, built on first use and then reused
+        self._sysinfo_dialog = None
+        self._sysinfo_text = None
+        self._sysinfo_task = None  # Keeps the running task's signals alive
+        
+        # Created by setup_monitoring()
+        self.monitor_timer = None
+        
+        # Created by _build_stats_group() once the window has painted
+        self.uptime_label = None
+        self.events_label = None
+        self.tray_interactions_label = None
+        
+        # Memory sampling (only available with psutil installed)
+        if proc is None and psutil is not None:
+            proc = psutil.Process()
+        self._proc = proc
+        self._last_rss_mb = -1
+        
+        # Construction steps are collected here and logged as one record
+        self._init_trace = []
+        self._trace("Initializing Control Window")
         
         # Setup user interface
         self.init_ui()
@@ -461,11 +1151,31 @@ class ControlWindow(QWidget):
         # Setup monitoring timers
         self.setup_monitoring()
         
-        self.logger.log("Control Window initialized successfully", "SYSTEM")
+        self._trace("Control Window initialized successfully")
+        self._flush_trace("ControlWindow.init")
+        
+    def _trace(self, step):
+        """
+        Record a construction step for the next structured init log.
+        
+        Args:
+            step (str): Description of the step
+        """
+        self._init_trace.append(step)
+        
+    def _flush_trace(self, phase):
+        """
+        Log all recorded construction steps as a single SYSTEM entry.
+        
+        Args:
+            phase (str): Name of the construction phase being reported
+        """
+        self.logger.log({"phase": phase, "steps": self._init_trace}, _LVL_SYSTEM)
+        self._init_trace = []
         
     def init_ui(self):
         """Initialize the user interface components."""
-        self.logger.log("Setting up Control Window UI components", "SYSTEM")
+        self._trace("Setting up Control Window UI components")
         
         # Window configuration
         self.setWindowTitle("Multiclient - Control Panel [DARK MODE]")
@@ -476,16 +1186,70 @@ class ControlWindow(QWidget):
         main_layout = QVBoxLayout()
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(20, 20, 20, 20)
+        self._main_layout = main_layout
+        
+        # === HEADER SECTION ===
+        header = QLabel("⚙️ CONTROL PANEL")
+        header_font = QFont("Arial", 16, QFont.Bold)
+        header.setFont(header_font)
+        header.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(header)
+        
+        # === STATUS AND CONTROL GROUPS ===
+        main_layout.addWidget(self._build_status_group())
+        main_layout.addWidget(self._build_control_group())
+        
+        # The testing and statistics groups go here, but are only built on
+        # the next event loop turn so the window can paint first
+        self._deferred_groups_index = main_layout.count()
+        QTimer.singleShot(0, self._add_deferred_groups)
+        
+        # === ACTION BUTTONS ===
+        self._trace("Creating main action buttons")
+        
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+        
+        # Restart button
+        self.restart_btn = QPushButton("🔄 Restart App")
+        self.restart_btn.setToolTip("Restart the application")
+        self._connect(self.restart_btn.clicked, self.restart_app)
+        self.restart_btn.setStyleSheet("background-color: #0078d4;")
+        button_layout.addWidget(self.restart_btn)
+        
+        # Exit button
+        self.exit_btn = QPushButton("❌ Exit App")
+        self.exit_btn.setToolTip("Exit the application safely")
+        self._connect(self.exit_btn.clicked, self.exit_app)
+        self.exit_btn.setStyleSheet("background-color: #d13438;")
+        button_layout.addWidget(self.exit_btn)
+        
+        main_layout.addLayout(button_layout)
+        
+        # Add stretch to push everything up
+        main_layout.addStretch()
+        
+        # Apply layout
+        self.setLayout(main_layout)
         
-        # === HEADER SECTION ===
-        header = QLabel("⚙️ CONTROL PANEL")
-        header_font = QFont("Arial", 16, QFont.Bold)
-        header.setFont(header_font)
-        header.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(header)
+        self._trace("Control Window UI setup completed")
+        
+    @pyqtSlot()
+    def _add_deferred_groups(self):
+        """Build the testing and statistics groups and insert them in place."""
+        index = self._deferred_groups_index
+        self._main_layout.insertWidget(index, self._build_test_group())
+        self._main_layout.insertWidget(index + 1, self._build_stats_group())
+        self._flush_trace("ControlWindow.deferred_groups")
+        
+    def _build_status_group(self):
+        """
+        Build the system status group.
         
-        # === STATUS GROUP ===
-        self.logger.log("Creating status monitoring group", "SYSTEM")
+        Returns:
+            QGroupBox: The populated group
+        """
+        self._trace("Creating status monitoring group")
         
         status_group = QGroupBox("📊 System Status")
         status_layout = QVBoxLayout()
@@ -493,11 +1257,11 @@ class ControlWindow(QWidget):
         
         # Application status
         self.status_label = QLabel("🟢 Status: Running")
-        self.status_label.setStyleSheet("color: #6bcf7f; font-weight: bold; font-size: 14px;")
+        self.status_label.setStyleSheet(self._STATUS_QSS_GREEN)
         status_layout.addWidget(self.status_label)
         
-        # Mutex status
-        self.mutex_label = QLabel("🔒 Mutex: Active (Singleton Mode)")
+        # Instance lock status
+        self.mutex_label = QLabel("🔒 Instance Lock: Active (Singleton Mode)")
         self.mutex_label.setStyleSheet("color: #74c0fc; font-size: 12px;")
         status_layout.addWidget(self.mutex_label)
         
@@ -506,53 +1270,62 @@ class ControlWindow(QWidget):
         self.tray_status_label.setStyleSheet("color: #74c0fc; font-size: 12px;")
         status_layout.addWidget(self.tray_status_label)
         
-        # Memory usage (placeholder for actual implementation)
-        self.memory_label = QLabel("💾 Memory: Monitoring...")
+        # Memory usage (sampled with psutil when it is installed)
+        if self._proc is not None:
+            self.memory_label = QLabel("💾 Memory: Monitoring...")
+        else:
+            self.memory_label = QLabel("💾 Memory: Unavailable (psutil not installed)")
         self.memory_label.setStyleSheet("color: #ffd93d; font-size: 12px;")
         status_layout.addWidget(self.memory_label)
         
         status_group.setLayout(status_layout)
-        main_layout.addWidget(status_group)
+        return status_group
         
-        # === CONTROL GROUP ===
-        self.logger.log("Creating application control group", "SYSTEM")
+    def _build_control_group(self):
+        """
+        Build the application controls group.
+        
+        Returns:
+            QGroupBox: The populated group
+        """
+        self._trace("Creating application control group")
         
         control_group = QGroupBox("🎛️ Application Controls")
         control_layout = QVBoxLayout()
         control_layout.setSpacing(10)
         
         # Monitoring controls
-        monitoring_layout = QHBoxLayout()
         self.monitor_cb = QCheckBox("Enable System Monitoring")
         self.monitor_cb.setChecked(True)
         self.monitor_cb.setToolTip("Enable/disable system event monitoring")
-        self.monitor_cb.stateChanged.connect(self.toggle_monitoring)
-        monitoring_layout.addWidget(self.monitor_cb)
-        control_layout.addLayout(monitoring_layout)
+        self._connect(self.monitor_cb.stateChanged[int], self.toggle_monitoring)
+        control_layout.addWidget(self.monitor_cb)
         
         # Detailed logging toggle
-        logging_layout = QHBoxLayout()
         self.detailed_log_cb = QCheckBox("Detailed Logging")
         self.detailed_log_cb.setChecked(True)
         self.detailed_log_cb.setToolTip("Enable detailed event logging")
-        self.detailed_log_cb.stateChanged.connect(self.toggle_detailed_logging)
-        logging_layout.addWidget(self.detailed_log_cb)
-        control_layout.addLayout(logging_layout)
+        self._connect(self.detailed_log_cb.stateChanged[int], self.toggle_detailed_logging)
+        control_layout.addWidget(self.detailed_log_cb)
         
         # Tray icon controls
-        tray_layout = QHBoxLayout()
         self.tray_cb = QCheckBox("Show Tray Icon")
         self.tray_cb.setChecked(True)
         self.tray_cb.setToolTip("Show/hide system tray icon")
-        self.tray_cb.stateChanged.connect(self.toggle_tray_icon)
-        tray_layout.addWidget(self.tray_cb)
-        control_layout.addLayout(tray_layout)
+        self._connect(self.tray_cb.stateChanged[int], self.toggle_tray_icon)
+        control_layout.addWidget(self.tray_cb)
         
         control_group.setLayout(control_layout)
-        main_layout.addWidget(control_group)
+        return control_group
         
-        # === TESTING GROUP ===
-        self.logger.log("Creating testing and diagnostics group", "SYSTEM")
+    def _build_test_group(self):
+        """
+        Build the testing and diagnostics group.
+        
+        Returns:
+            QGroupBox: The populated group
+        """
+        self._trace("Creating testing and diagnostics group")
         
         test_group = QGroupBox("🧪 Testing & Diagnostics")
         test_layout = QVBoxLayout()
@@ -564,13 +1337,13 @@ class ControlWindow(QWidget):
         # Test tray icon
         self.test_tray_btn = QPushButton("Test Tray Icon")
         self.test_tray_btn.setToolTip("Test tray icon functionality")
-        self.test_tray_btn.clicked.connect(self.test_tray_icon)
+        self._connect(self.test_tray_btn.clicked, self.test_tray_icon)
         test_buttons_layout.addWidget(self.test_tray_btn)
         
         # Generate test log entries
         self.test_log_btn = QPushButton("Generate Test Logs")
         self.test_log_btn.setToolTip("Generate sample log entries for testing")
-        self.test_log_btn.clicked.connect(self.generate_test_logs)
+        self._connect(self.test_log_btn.clicked, self.generate_test_logs)
         test_buttons_layout.addWidget(self.test_log_btn)
         
         test_layout.addLayout(test_buttons_layout)
@@ -578,165 +1351,131 @@ class ControlWindow(QWidget):
         # System info button
         self.sysinfo_btn = QPushButton("📋 System Information")
         self.sysinfo_btn.setToolTip("Display detailed system information")
-        self.sysinfo_btn.clicked.connect(self.show_system_info)
+        self._connect(self.sysinfo_btn.clicked, self.show_system_info)
         test_layout.addWidget(self.sysinfo_btn)
         
         test_group.setLayout(test_layout)
-        main_layout.addWidget(test_group)
+        return test_group
         
-        # === STATISTICS GROUP ===
-        self.logger.log("Creating statistics monitoring group", "SYSTEM")
+    def _build_stats_group(self):
+        """
+        Build the statistics group.
+        
+        Returns:
+            QGroupBox: The populated group
+        """
+        self._trace("Creating statistics monitoring group")
         
         stats_group = QGroupBox("📈 Statistics")
         stats_layout = QVBoxLayout()
         stats_layout.setSpacing(8)
         
+        # Each statistic is a static prefix label plus a value label, so
+        # updates only replace the value text
+        
         # Uptime display
-        self.uptime_label = QLabel("⏱️ Uptime: 00:00:00")
-        self.uptime_label.setStyleSheet("color: #74c0fc; font-size: 12px; font-family: 'Consolas';")
-        stats_layout.addWidget(self.uptime_label)
+        self.uptime_label = self._add_stat_row(
+            stats_layout, "⏱️ Uptime:",
+            "color: #74c0fc; font-size: 12px; font-family: 'Consolas';"
+        )
+        self.uptime_label.setText(self.get_uptime_string())
         
         # Event counters
-        self.events_label = QLabel("📊 Events Logged: 0")
-        self.events_label.setStyleSheet("color: #74c0fc; font-size: 12px;")
-        stats_layout.addWidget(self.events_label)
+        self.events_label = self._add_stat_row(
+            stats_layout, "📊 Events Logged:", "color: #74c0fc; font-size: 12px;"
+        )
+        self.events_label.setNum(self.event_count)
         
         # Tray interactions
-        self.tray_interactions_label = QLabel("🖱️ Tray Interactions: 0")
-        self.tray_interactions_label.setStyleSheet("color: #74c0fc; font-size: 12px;")
-        stats_layout.addWidget(self.tray_interactions_label)
+        self.tray_interactions_label = self._add_stat_row(
+            stats_layout, "🖱️ Tray Interactions:", "color: #74c0fc; font-size: 12px;"
+        )
+        self.tray_interactions_label.setNum(self.tray_interaction_count)
         
         stats_group.setLayout(stats_layout)
-        main_layout.addWidget(stats_group)
+        return stats_group
         
-        # === ACTION BUTTONS ===
-        self.logger.log("Creating main action buttons", "SYSTEM")
-        
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
+    def _add_stat_row(self, layout, prefix, style):
+        """
+        Add a statistics row made of a static prefix and a value label.
         
-        # Restart button
-        self.restart_btn = QPushButton("🔄 Restart App")
-        self.restart_btn.setToolTip("Restart the application")
-        self.restart_btn.clicked.connect(self.restart_app)
-        self.restart_btn.setStyleSheet("background-color: #0078d4;")
-        button_layout.addWidget(self.restart_btn)
+        Args:
+            layout (QVBoxLayout): The layout to add the row to
+            prefix (str): Static text shown before the value
+            style (str): Stylesheet applied to both labels
+            
+        Returns:
+            QLabel: The value label
+        """
+        row_layout = QHBoxLayout()
         
-        # Exit button
-        self.exit_btn = QPushButton("❌ Exit App")
-        self.exit_btn.setToolTip("Exit the application safely")
-        self.exit_btn.clicked.connect(self.exit_app)
-        self.exit_btn.setStyleSheet("background-color: #d13438;")
-        button_layout.addWidget(self.exit_btn)
+        prefix_label = QLabel(prefix)
+        prefix_label.setStyleSheet(style)
+        row_layout.addWidget(prefix_label)
         
-        main_layout.addLayout(button_layout)
+        value_label = QLabel()
+        value_label.setStyleSheet(style)
+        row_layout.addWidget(value_label)
         
-        # Add stretch to push everything up
-        main_layout.addStretch()
+        row_layout.addStretch()
+        layout.addLayout(row_layout)
+        return value_label
         
-        # Apply layout
-        self.setLayout(main_layout)
+    def _connect(self, signal, slot):
+        """
+        Connect a bound signal to a slot, failing early on a bad slot.
         
-        self.logger.log("Control Window UI setup completed", "SYSTEM")
+        Args:
+            signal (pyqtBoundSignal): The signal, with its overload selected
+            slot (callable): The method to connect
+            
+        Raises:
+            TypeError: If slot is not callable
+        """
+        if not callable(slot):
+            raise TypeError(f"Cannot connect signal to non-callable slot: {slot!r}")
+        signal.connect(slot)
         
     def apply_dark_theme(self):
         """Apply dark theme styling to the control window."""
-        self.logger.log("Applying dark theme to Control Window", "SYSTEM")
+        self._trace("Applying dark theme to Control Window")
         
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QGroupBox {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 8px;
-                padding-top: 12px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #ffffff;
-            }
-            
-            QPushButton {
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 6px;
-                padding: 10px 16px;
-                color: #ffffff;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #707070;
-            }
-            
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-                font-size: 12px;
-            }
-            
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                background-color: #404040;
-                border: 2px solid #606060;
-                border-radius: 4px;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #106ebe;
-            }
-            
-            QCheckBox::indicator:checked:hover {
-                background-color: #106ebe;
-            }
-            
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(CONTROL_WINDOW_STYLESHEET)
         
     def setup_monitoring(self):
         """Setup monitoring timers and counters."""
-        self.logger.log("Setting up monitoring systems", "SYSTEM")
-        
-        # Track application start time
-        self.start_time = QDateTime.currentDateTime()
+        self._trace("Setting up monitoring systems")
         
-        # Initialize counters
+        # Initialize counters (tray_interaction_count is set in __init__)
         self.event_count = 0
-        self.tray_interaction_count = 0
-        
-        # Setup uptime timer (updates every second)
-        self.uptime_timer = QTimer()
-        self.uptime_timer.timeout.connect(self.update_uptime)
-        self.uptime_timer.start(1000)
-        self.logger.log("Uptime monitoring started (1s interval)", "SYSTEM")
-        
-        # Setup system monitoring timer (updates every 5 seconds)
-        self.system_timer = QTimer()
-        self.system_timer.timeout.connect(self.update_system_stats)
-        self.system_timer.start(5000)
-        self.logger.log("System statistics monitoring started (5s interval)", "SYSTEM")
-        
+        self._pending_tray_update = False  # Tray label refresh due on next tick
+        
+        # Setup a single monitoring timer (ticks every second). Uptime is
+        # refreshed on every tick, system statistics on every 5th tick.
+        # The timer only runs while the window is visible (see showEvent)
+        self._tick = 0
+        self.monitor_timer = QTimer()
+        self.monitor_timer.setInterval(1000)
+        self.monitor_timer.timeout.connect(self._on_tick)
+        self.update_monitor_timer()
+        self._trace("Monitoring set up (uptime 1s, statistics 5s interval)")
+        
+    @pyqtSlot()
+    def _on_tick(self):
+        """Handle a monitoring timer tick."""
+        self._tick += 1
+        self.update_uptime()
+        
+        # Apply tray interaction count changes at most once per tick
+        if self._pending_tray_update:
+            self._pending_tray_update = False
+            self.tray_interactions_label.setNum(self.tray_interaction_count)
+            
+        if self._tick % 5 == 0:
+            self.update_system_stats()
+            
+
+    @pyqtSlot(int)
     def toggle_monitoring(self, state):
         """
         Toggle system monitoring on/off.
@@ -747,16 +1486,19 @@ class ControlWindow(QWidget):
         self.monitoring_enabled = state == Qt.Checked
         status = "enabled" if self.monitoring_enabled else "disabled"
         
-        self.logger.log(f"System monitoring {status} by user", "ACTION")
+        self.logger.log(f"System monitoring {status} by user", _LVL_ACTION)
         
         # Update status display
         if self.monitoring_enabled:
             self.status_label.setText("🟢 Status: Running (Monitoring Active)")
-            self.status_label.setStyleSheet("color: #6bcf7f; font-weight: bold; font-size: 14px;")
+            self.status_label.setStyleSheet(self._STATUS_QSS_GREEN)
         else:
             self.status_label.setText("🟡 Status: Running (Monitoring Paused)")
-            self.status_label.setStyleSheet("color: #ffd93d; font-weight: bold; font-size: 14px;")
+            self.status_label.setStyleSheet(self._STATUS_QSS_YELLOW)
             
+        self.update_monitor_timer()
+        
+    @pyqtSlot(int)
     def toggle_detailed_logging(self, state):
         """
         Toggle detailed logging on/off.
@@ -767,8 +1509,23 @@ class ControlWindow(QWidget):
         self.detailed_logging = state == Qt.Checked
         status = "enabled" if self.detailed_logging else "disabled"
         
-        self.logger.log(f"Detailed logging {status} by user", "ACTION")
+        self.logger.log(f"Detailed logging {status} by user", _LVL_ACTION)
+        self.update_monitor_timer()
         
+    def update_monitor_timer(self):
+        """Run the monitoring timer only while there is something to monitor."""
+        if self.monitor_timer is None:
+            return
+            
+        # Labels nobody can see (window hidden in the tray) or nothing to
+        # update - stop waking the event loop entirely
+        if self.isVisible() and (self.monitoring_enabled or self.detailed_logging):
+            if not self.monitor_timer.isActive():
+                self.monitor_timer.start()
+        else:
+            self.monitor_timer.stop()
+            
+    @pyqtSlot(int)
     def toggle_tray_icon(self, state):
         """
         Toggle tray icon visibility.
@@ -779,17 +1536,18 @@ class ControlWindow(QWidget):
         if state == Qt.Checked:
             self.tray_icon.show()
             self.tray_status_label.setText("📍 Tray Icon: Visible")
-            self.tray_status_label.setStyleSheet("color: #6bcf7f; font-size: 12px;")
-            self.logger.log("Tray icon shown by user", "ACTION")
+            self.tray_status_label.setStyleSheet(self._TRAY_QSS_GREEN)
+            self.logger.log("Tray icon shown by user", _LVL_ACTION)
         else:
             self.tray_icon.hide()
             self.tray_status_label.setText("📍 Tray Icon: Hidden")
-            self.tray_status_label.setStyleSheet("color: #ff6b6b; font-size: 12px;")
-            self.logger.log("Tray icon hidden by user", "ACTION")
+            self.tray_status_label.setStyleSheet(self._TRAY_QSS_RED)
+            self.logger.log("Tray icon hidden by user", _LVL_ACTION)
             
+    @pyqtSlot()
     def test_tray_icon(self):
         """Test tray icon functionality."""
-        self.logger.log("Tray icon test initiated by user", "ACTION")
+        self.logger.log("Tray icon test initiated by user", _LVL_ACTION)
         
         if self.tray_icon.isVisible():
             # Update tooltip with current timestamp
@@ -797,103 +1555,118 @@ class ControlWindow(QWidget):
             new_tooltip = f"Multiclient - Test at {test_timestamp}"
             self.tray_icon.setToolTip(new_tooltip)
             
-            self.logger.log(f"Tray icon tooltip updated: {new_tooltip}", "ACTION")
+            self.logger.log(f"Tray icon tooltip updated: {new_tooltip}", _LVL_ACTION)
             
             # Show confirmation message
             QMessageBox.information(self, "Test Successful", 
                                   f"Tray icon test completed!\nTooltip updated to: {new_tooltip}")
         else:
-            self.logger.log("Cannot test tray icon - icon is hidden", "WARNING")
+            self.logger.log("Cannot test tray icon - icon is hidden", _LVL_WARNING)
             QMessageBox.warning(self, "Test Failed", 
                               "Cannot test tray icon because it is currently hidden.\n"
                               "Enable 'Show Tray Icon' first.")
             
+    @pyqtSlot()
     def generate_test_logs(self):
         """Generate sample log entries for testing purposes."""
-        self.logger.log("Generating test log entries", "ACTION")
+        self.logger.log("Generating test log entries", _LVL_ACTION)
         
-        # Generate various types of test logs
-        test_messages = [
-            ("Test INFO message - Application checkpoint", "INFO"),
-            ("Test WARNING message - Minor issue detected", "WARNING"),
-            ("Test ERROR message - Simulated error condition", "ERROR"),
-            ("Test ACTION message - User performed action", "ACTION"),
-            ("Test EVENT message - System event occurred", "EVENT"),
-            ("Test SYSTEM message - Internal system operation", "SYSTEM")
-        ]
+        # Generate various types of test logs in one batch
+        self.logger.log_many(_TEST_MESSAGES)
         
-        for message, level in test_messages:
-            self.logger.log(message, level)
-            
-        self.logger.log("Test log generation completed", "ACTION")
+        self.logger.log("Test log generation completed", _LVL_ACTION)
         
+    @pyqtSlot()
     def show_system_info(self):
         """Display detailed system information."""
-        self.logger.log("System information requested by user", "ACTION")
+        self.logger.log("System information requested by user", _LVL_ACTION)
         
         try:
-            # Gather system information
-            info_text = f"""System Information
-{'=' * 50}
-
-Application Details:
-- Name: Multiclient Debug Version
-- Version: 1.0.0
-- Python Version: {sys.version}
-- PyQt5 Version: Available
-- Platform: {sys.platform}
-
-Current Status:
-- Monitoring: {'Enabled' if self.monitoring_enabled else 'Disabled'}
-- Detailed Logging: {'Enabled' if self.detailed_logging else 'Disabled'}
-- Tray Icon: {'Visible' if self.tray_icon.isVisible() else 'Hidden'}
-- Uptime: {self.get_uptime_string()}
-
-Statistics:
-- Events Logged: {self.event_count}
-- Tray Interactions: {self.tray_interaction_count}
-
-Process Information:
-- Process ID: {os.getpid()}
-- Working Directory: {os.getcwd()}
-"""
-            
-            # Create and show information dialog
-            dialog = QDialog(self)
-            dialog.setWindowTitle("System Information")
-            dialog.setModal(True)
-            dialog.resize(600, 500)
-            
-            layout = QVBoxLayout()
-            
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setPlainText(info_text)
-            text_edit.setFont(QFont("Consolas", 10))
-            layout.addWidget(text_edit)
-            
-            # Close button
-            close_btn = QPushButton("Close")
-            close_btn.clicked.connect(dialog.close)
-            layout.addWidget(close_btn)
-            
-            dialog.setLayout(layout)
-            
-            # Apply dark theme to dialog
-            dialog.setStyleSheet(self.styleSheet())
-            
-            dialog.exec_()
+            # Capture GUI-side values here; the rest of the report is
+            # gathered on the global thread pool
+            status = {
+                'monitoring': self.monitoring_enabled,
+                'detailed_logging': self.detailed_logging,
+                'tray_visible': self.tray_icon.isVisible(),
+                'uptime': self.get_uptime_string(),
+                'event_count': self.event_count,
+                'tray_interaction_count': self.tray_interaction_count,
+            }
+            task = SystemInfoTask(status)
+            task.signals.finished.connect(self.on_system_info_ready)
+            task.signals.failed.connect(self.on_system_info_failed)
+            self._sysinfo_task = task
+            
+            # Show information dialog, creating it on first use
+            if self._sysinfo_dialog is None:
+                self.build_system_info_dialog()
+                
+            self._sysinfo_text.setPlainText("Gathering system information...")
+            QThreadPool.globalInstance().start(task)
+            self._sysinfo_dialog.exec_()
             
-            self.logger.log("System information dialog displayed", "ACTION")
+            self.logger.log("System information dialog displayed", _LVL_ACTION)
             
         except Exception as e:
             error_msg = f"Error gathering system information: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             QMessageBox.critical(self, "Error", error_msg)
             
+    @pyqtSlot(str)
+    def on_system_info_ready(self, info_text):
+        """
+        Show a finished system information report.
+        
+        Args:
+            info_text (str): The report text
+        """
+        if self._sysinfo_text is not None:
+            self._sysinfo_text.setPlainText(info_text)
+            
+    @pyqtSlot(str)
+    def on_system_info_failed(self, error):
+        """
+        Report a failure while gathering system information.
+        
+        Args:
+            error (str): Description of the error
+        """
+        error_msg = f"Error gathering system information: {error}"
+        self.logger.log(error_msg, _LVL_ERROR)
+        if self._sysinfo_text is not None:
+            self._sysinfo_text.setPlainText(error_msg)
+            
+    def build_system_info_dialog(self):
+        """Create the system information dialog and keep it for reuse."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("System Information")
+        dialog.setModal(True)
+        dialog.resize(600, 500)
+        
+        layout = QVBoxLayout()
+        
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.setFont(QFont("Consolas", 10))
+        layout.addWidget(text_edit)
+        
+        # Close button
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.close)
+        layout.addWidget(close_btn)
+        
+        dialog.setLayout(layout)
+        
+        # Apply dark theme to dialog
+        dialog.setStyleSheet(CONTROL_WINDOW_STYLESHEET)
+        
+        self._sysinfo_dialog = dialog
+        self._sysinfo_text = text_edit
+        
+    @pyqtSlot()
     def restart_app(self):
         """Handle application restart request."""
-        self.logger.log("Application restart requested by user", "ACTION")
+        self.logger.log("Application restart requested by user", _LVL_ACTION)
         
         reply = QMessageBox.question(
             self, "Restart Application", 
@@ -904,7 +1677,7 @@ Process Information:
         )
         
         if reply == QMessageBox.Yes:
-            self.logger.log("Application restart confirmed by user", "ACTION")
+            self.logger.log("Application restart confirmed by user", _LVL_ACTION)
             
             # In a real implementation, you would:
             # 1. Save current state
@@ -915,13 +1688,14 @@ Process Information:
                                   "Restart functionality is implemented as a placeholder.\n"
                                   "In a production version, this would restart the process.")
             
-            self.logger.log("Restart operation completed (placeholder)", "ACTION")
+            self.logger.log("Restart operation completed (placeholder)", _LVL_ACTION)
         else:
-            self.logger.log("Application restart cancelled by user", "ACTION")
+            self.logger.log("Application restart cancelled by user", _LVL_ACTION)
             
+    @pyqtSlot()
     def exit_app(self):
         """Handle application exit request."""
-        self.logger.log("Application exit requested by user", "ACTION")
+        self.logger.log("Application exit requested by user", _LVL_ACTION)
         
         reply = QMessageBox.question(
             self, "Exit Application", 
@@ -932,7 +1706,7 @@ Process Information:
         )
         
         if reply == QMessageBox.Yes:
-            self.logger.log("Application exit confirmed by user - initiating shutdown", "ACTION")
+            self.logger.log("Application exit confirmed by user - initiating shutdown", _LVL_ACTION)
             
             # Perform cleanup operations
             self.cleanup_before_exit()
@@ -940,41 +1714,40 @@ Process Information:
             # Exit the application
             self.app.quit()
         else:
-            self.logger.log("Application exit cancelled by user", "ACTION")
+            self.logger.log("Application exit cancelled by user", _LVL_ACTION)
             
     def cleanup_before_exit(self):
         """Perform cleanup operations before application exit."""
-        self.logger.log("Performing cleanup operations before exit", "SYSTEM")
+        self.logger.log("Performing cleanup operations before exit", _LVL_SYSTEM)
         
         try:
-            # Stop all timers
-            if hasattr(self, 'uptime_timer'):
-                self.uptime_timer.stop()
-                self.logger.log("Uptime timer stopped", "SYSTEM")
-                
-            if hasattr(self, 'system_timer'):
-                self.system_timer.stop()
-                self.logger.log("System monitoring timer stopped", "SYSTEM")
+            # Stop the monitoring timer
+            if self.monitor_timer is not None:
+                self.monitor_timer.stop()
+                self.logger.log("Monitoring timer stopped", _LVL_SYSTEM)
                 
             # Hide tray icon
             if self.tray_icon.isVisible():
                 self.tray_icon.hide()
-                self.logger.log("Tray icon hidden", "SYSTEM")
+                self.logger.log("Tray icon hidden", _LVL_SYSTEM)
                 
-            self.logger.log("Cleanup operations completed successfully", "SYSTEM")
+            self.logger.log("Cleanup operations completed successfully", _LVL_SYSTEM)
             
         except Exception as e:
-            self.logger.log(f"Error during cleanup: {str(e)}", "ERROR")
+            self.logger.log(f"Error during cleanup: {str(e)}", _LVL_ERROR)
             
+    @pyqtSlot()
     def update_uptime(self):
         """Update the uptime display."""
         if self.monitoring_enabled and self.detailed_logging:
             # Only log uptime updates if detailed logging is enabled
             pass  # Removed frequent uptime logging to reduce spam
             
-        # Calculate uptime
+        # Calculate uptime, skipping the label update if nothing changed
         uptime_string = self.get_uptime_string()
-        self.uptime_label.setText(f"⏱️ Uptime: {uptime_string}")
+        if uptime_string != self._last_uptime_str:
+            self._last_uptime_str = uptime_string
+            self.uptime_label.setText(uptime_string)
         
     def get_uptime_string(self):
         """
@@ -983,41 +1756,60 @@ Process Information:
         Returns:
             str: Formatted uptime string (HH:MM:SS)
         """
-        current_time = QDateTime.currentDateTime()
-        uptime_ms = self.start_time.msecsTo(current_time)
-        uptime_seconds = uptime_ms // 1000
-        
-        hours = uptime_seconds // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
-        
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _APP_UPTIME.text()
         
+    @pyqtSlot()
     def update_system_stats(self):
         """Update system statistics display."""
         if self.monitoring_enabled:
             try:
                 # Update event counter (this would be connected to actual event counting)
                 self.event_count += 1  # Placeholder increment
-                self.events_label.setText(f"📊 Events Logged: {self.event_count}")
+                self.events_label.setNum(self.event_count)
                 
-                # Update memory usage (placeholder - in real implementation use psutil)
-                self.memory_label.setText("💾 Memory: ~15MB (Estimated)")
+                # Update memory usage, only touching the label when the
+                # resident size has moved by at least 1 MB
+                if self._proc is not None:
+                    rss_mb = self._proc.memory_info().rss >> 20
+                    if abs(rss_mb - self._last_rss_mb) >= 1:
+                        self._last_rss_mb = rss_mb
+                        self.memory_label.setText(f"💾 Memory: {rss_mb} MB")
                 
                 if self.detailed_logging:
-                    self.logger.log("System statistics updated", "SYSTEM")
+                    self.logger.log("System statistics updated", _LVL_SYSTEM)
                     
             except Exception as e:
-                self.logger.log(f"Error updating system stats: {str(e)}", "ERROR")
+                self.logger.log(f"Error updating system stats: {str(e)}", _LVL_ERROR)
                 
+    @pyqtSlot()
     def increment_tray_interactions(self):
         """Increment tray interaction counter."""
         self.tray_interaction_count += 1
-        self.tray_interactions_label.setText(f"🖱️ Tray Interactions: {self.tray_interaction_count}")
+        
+        # While the monitoring timer runs, the label is refreshed by the next
+        # tick, so a burst of clicks costs a single repaint. With the timer
+        # stopped there is no next tick, so update it right away.
+        if self.monitor_timer.isActive():
+            self._pending_tray_update = True
+        elif self.tray_interactions_label is not None:
+            self.tray_interactions_label.setNum(self.tray_interaction_count)
+        
+    def showEvent(self, event):
+        """Handle window show event by resuming monitoring."""
+        super().showEvent(event)
+        self.update_monitor_timer()
+        if self.uptime_label is not None and self.monitor_timer.isActive():
+            # Bring the uptime up to date right away instead of on next tick
+            self.update_uptime()
+            
+    def hideEvent(self, event):
+        """Handle window hide event by pausing monitoring."""
+        super().hideEvent(event)
+        self.update_monitor_timer()
         
     def closeEvent(self, event):
         """Handle window close event."""
-        self.logger.log("Control Window close requested", "EVENT")
+        self.logger.log("Control Window close requested", _LVL_EVENT)
         # Hide instead of closing to keep it available
         self.hide()
         event.ignore()
@@ -1032,18 +1824,78 @@ class MulticlientDebug:
     Main application class that orchestrates all components.
     
     This class handles:
-    - Application initialization and mutex management
+    - Application initialization and single-instance locking
     - System tray icon creation and management
     - Debug window coordination
     - Event handling and logging
     - Application lifecycle management
     """
     
+    # QIcon for the tray (not the QSystemTrayIcon, which is self.tray_icon),
+    # built once per process on first use (needs a QApplication)
+    _TRAY_QICON = None
+    
+    # Readable names for tray icon activation reasons
+    _ACTIVATION_REASONS = {
+        QSystemTrayIcon.Trigger: "Single Left Click",
+        QSystemTrayIcon.DoubleClick: "Double Left Click",
+        QSystemTrayIcon.MiddleClick: "Middle Click",
+        QSystemTrayIcon.Context: "Right Click (Context Menu)"
+    }
+    
+    # Tray menu contents: (label, tooltip, handler method name), None = separator
+    _MENU_ITEMS = (
+        # Debug window options
+        ('📋 Show Log Window', "Open the debug log window", '_show_log'),
+        ('⚙️ Show Control Panel', "Open the application control panel", '_show_control'),
+        None,
+        # Quick actions
+        ('🧪 Generate Test Logs', "Generate sample log entries", 'generate_quick_test_logs'),
+        ('ℹ️ System Info', "Show system information", 'show_quick_system_info'),
+        None,
+        # Exit option
+        ('❌ Exit Application', "Exit the application completely", 'safe_exit'),
+    )
+    
     def __init__(self):
         """Initialize the main application."""
         # Create logger first so we can log everything
         self.logger = Logger()
-        self.logger.log("=== MULTICLIENT DEBUG APPLICATION STARTING ===", "SYSTEM")
+        self.logger.log("=== MULTICLIENT DEBUG APPLICATION STARTING ===", _LVL_SYSTEM)
+        
+        # Quick info text - everything except uptime is fixed for the process
+        self._static_sysinfo = (sys.platform, sys.version.split()[0], os.getpid())
+        self._sysinfo_template = (
+            "Multiclient Debug - Quick Info\n"
+            "\n"
+            "🕐 Uptime: {0}\n"
+            "🖥️ Platform: {1}\n"
+            "🐍 Python: {2}\n"
+            "💾 Process ID: {3}\n"
+            "📍 Status: Running\n"
+            "\n"
+            "Right-click tray icon for more options."
+        )
+        
+        # UI objects are created later (windows only on demand), so start
+        # them as None and test with "is not None" instead of hasattr()
+        self.tray_icon = None
+        self.log_window = None
+        self.control_window = None
+        
+        # Tray clicks, counted here so clicks made before the control
+        # window exists are included when it is built
+        self.tray_interaction_count = 0
+        
+        # Primary screen geometry, queried on first window placement
+        self._screen_geom = None
+        
+        # Tray message boxes, built on first use and reused afterwards
+        self._info_box = None
+        self._exit_box = None
+        
+        # Startup prefetch of process resources (see ProcessPrefetchTask)
+        self._prefetch = None
         
         # Initialize all application components
         self.init_app()
@@ -1051,286 +1903,291 @@ class MulticlientDebug:
     def init_app(self):
         """Initialize all application components."""
         try:
-            self.logger.log("Beginning application initialization sequence", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Beginning application initialization sequence", _LVL_SYSTEM)
             
             # === STEP 1: MUTEX MANAGEMENT ===
-            self.logger.log("Step 1: Checking for existing application instances", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 1: Checking for existing application instances", _LVL_SYSTEM)
             self.setup_mutex()
             
             # === STEP 2: QT APPLICATION SETUP ===
-            self.logger.log("Step 2: Setting up Qt Application framework", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 2: Setting up Qt Application framework", _LVL_SYSTEM)
             self.setup_qt_application()
             
+            # Prepare process resources in the background meanwhile
+            self._prefetch = ProcessPrefetchTask()
+            QThreadPool.globalInstance().start(self._prefetch)
+            
             # === STEP 3: SYSTEM TRAY VERIFICATION ===
-            self.logger.log("Step 3: Verifying system tray availability", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 3: Verifying system tray availability", _LVL_SYSTEM)
             self.verify_system_tray()
             
             # === STEP 4: CREATE SYSTEM TRAY ICON ===
-            self.logger.log("Step 4: Creating and configuring system tray icon", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 4: Creating and configuring system tray icon", _LVL_SYSTEM)
             self.create_tray_icon()
             
             # === STEP 5: CREATE DEBUG WINDOWS ===
-            self.logger.log("Step 5: Creating debug interface windows", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 5: Creating debug interface windows", _LVL_SYSTEM)
             self.create_debug_windows()
             
             # === STEP 6: SETUP EVENT HANDLERS ===
-            self.logger.log("Step 6: Setting up event handlers and signals", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 6: Setting up event handlers and signals", _LVL_SYSTEM)
             self.setup_event_handlers()
             
             # === STEP 7: SHOW INTERFACE ===
-            self.logger.log("Step 7: Displaying user interface components", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("Step 7: Displaying user interface components", _LVL_SYSTEM)
             self.show_interface()
             
-            self.logger.log("=== APPLICATION INITIALIZATION COMPLETED SUCCESSFULLY ===", "SYSTEM")
+            self.logger.log("=== APPLICATION INITIALIZATION COMPLETED SUCCESSFULLY ===", _LVL_SYSTEM)
             
-        except Exception as e:
-            error_msg = f"CRITICAL ERROR during initialization: {str(e)}\n{traceback.format_exc()}"
-            self.logger.log(error_msg, "ERROR")
+        except Exception:
+            self.logger.log_exception("CRITICAL ERROR during initialization", _LVL_ERROR)
             sys.exit(1)
             
     def setup_mutex(self):
-        """Setup Windows mutex for singleton application behavior."""
-        self.logger.log("Creating Windows mutex for singleton enforcement", "SYSTEM")
+        """
+        Setup an exclusive lock file for singleton application behavior.
+        
+        The lock is only used to detect another running instance, so a
+        byte-range lock on a file is enough - no named kernel mutex needed.
+        The handle is kept open for the lifetime of the process and the
+        lock is released by Windows when the process exits.
+        
+        client.pyw takes the same lock file, so the debug build and the
+        normal client still cannot run at the same time.
+        """
+        if DEBUG_VERBOSE:
+            self.logger.log("Acquiring instance lock file for singleton enforcement", _LVL_SYSTEM)
+        
+        # Open (or create) the lock file
+        lock_path = os.path.join(_APP_DATA_DIR, "multiclient.lock")
+        self._lock_handle = win32file.CreateFile(
+            lock_path,
+            win32con.GENERIC_READ | win32con.GENERIC_WRITE,
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE,
+            None,
+            win32con.OPEN_ALWAYS,
+            win32con.FILE_ATTRIBUTE_NORMAL,
+            None
+        )
         
+        # Try to lock it without waiting
         try:
-            # Create named mutex
-            self.mutex = win32event.CreateMutex(None, 1, 'multiclient_singletonMutex')
-            
+            win32file.LockFileEx(
+                self._lock_handle,
+                win32con.LOCKFILE_EXCLUSIVE_LOCK | win32con.LOCKFILE_FAIL_IMMEDIATELY,
+                1, 0,
+                pywintypes.OVERLAPPED()
+            )
+        except pywintypes.error as e:
             # Check if another instance is already running
-            last_error = win32api.GetLastError()
-            if last_error == 183:  # ERROR_ALREADY_EXISTS
-                self.logger.log("Another instance of the application is already running", "ERROR")
-                self.logger.log("Application will now exit to maintain singleton behavior", "ERROR")
+            if e.winerror == winerror.ERROR_LOCK_VIOLATION:
+                self.logger.log("Another instance of the application is already running", _LVL_ERROR)
+                self.logger.log("Application will now exit to maintain singleton behavior", _LVL_ERROR)
                 sys.exit(0)
-            else:
-                self.logger.log("Mutex acquired successfully - this is the only running instance", "SYSTEM")
-                
-        except Exception as e:
-            error_msg = f"Error creating mutex: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
             raise
+        
+        if DEBUG_VERBOSE:
+            self.logger.log("Instance lock acquired successfully - this is the only running instance", _LVL_SYSTEM)
             
     def setup_qt_application(self):
         """Setup the Qt application framework."""
-        self.logger.log("Creating QApplication instance", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Creating QApplication instance", _LVL_SYSTEM)
         
-        try:
-            # Create QApplication with empty arguments list
-            self.app = QApplication([])
-            
-            # Configure application behavior
-            self.app.setQuitOnLastWindowClosed(False)  # Don't quit when windows close
-            self.logger.log("QApplication configured to continue running when windows close", "SYSTEM")
-            
-            # Set application properties
-            self.app.setApplicationName("Multiclient Debug")
-            self.app.setApplicationVersion("1.0.0")
-            self.app.setOrganizationName("Debug Tools")
-            
-            self.logger.log("QApplication created and configured successfully", "SYSTEM")
-            
-        except Exception as e:
-            error_msg = f"Error setting up Qt application: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+        # Create QApplication with empty arguments list
+        self.app = QApplication([])
+        
+        # Configure application behavior
+        self.app.setQuitOnLastWindowClosed(False)  # Don't quit when windows close
+        if DEBUG_VERBOSE:
+            self.logger.log("QApplication configured to continue running when windows close", _LVL_SYSTEM)
+        
+        # Set application properties
+        self.app.setApplicationName("Multiclient Debug")
+        self.app.setApplicationVersion("1.0.0")
+        self.app.setOrganizationName("Debug Tools")
+        
+        if DEBUG_VERBOSE:
+            self.logger.log("QApplication created and configured successfully", _LVL_SYSTEM)
             
     def verify_system_tray(self):
         """Verify that system tray is available on this system."""
-        self.logger.log("Checking system tray availability", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Checking system tray availability", _LVL_SYSTEM)
         
+        flag_path = os.path.join(_APP_DATA_DIR, "multiclient_tray.flag")
+        
+        # Skip the shell probe if it succeeded recently
+        try:
+            if time.time() - os.path.getmtime(flag_path) < TRAY_CHECK_CACHE_SECONDS:
+                if DEBUG_VERBOSE:
+                    self.logger.log("System tray availability confirmed recently - skipping check", _LVL_SYSTEM)
+                return
+        except OSError:
+            pass  # No flag file yet
+            
         if not QSystemTrayIcon.isSystemTrayAvailable():
             error_msg = "System tray is not available on this system"
-            self.logger.log(error_msg, "ERROR")
-            self.logger.log("Application cannot continue without system tray support", "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
+            self.logger.log("Application cannot continue without system tray support", _LVL_ERROR)
             QMessageBox.critical(None, "System Tray Error", 
                                "System tray is not available on this system.\n"
                                "The application requires system tray support to function.")
             sys.exit(1)
         else:
-            self.logger.log("System tray is available and ready for use", "SYSTEM")
+            if DEBUG_VERBOSE:
+                self.logger.log("System tray is available and ready for use", _LVL_SYSTEM)
+                
+            # Remember the result for the next start
+            try:
+                with open(flag_path, 'wb') as f:
+                    f.write(b"1")
+            except OSError:
+                pass  # Caching is best effort
             
     def create_tray_icon(self):
         """Create and configure the system tray icon."""
-        self.logger.log("Creating system tray icon", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Creating system tray icon", _LVL_SYSTEM)
         
-        try:
-            # Create system tray icon with standard maximize button icon
-            standard_icon = self.app.style().standardIcon(self.app.style().SP_TitleBarMaxButton)
-            self.tray_icon = QSystemTrayIcon(standard_icon)
-            
-            self.logger.log("System tray icon object created", "SYSTEM")
-            
-            # Create context menu for tray icon
-            self.create_tray_menu()
-            
-            # Set initial tooltip
-            self.tray_icon.setToolTip('Multiclient (Debug Mode) - Right-click for options')
-            self.logger.log("Tray icon tooltip configured", "SYSTEM")
-            
-        except Exception as e:
-            error_msg = f"Error creating tray icon: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+        # Create system tray icon with standard maximize button icon,
+        # resolving the style only once and reusing the rendered icon
+        if MulticlientDebug._TRAY_QICON is None:
+            style = self.app.style()
+            MulticlientDebug._TRAY_QICON = style.standardIcon(QStyle.SP_TitleBarMaxButton)
+        self.tray_icon = QSystemTrayIcon(MulticlientDebug._TRAY_QICON)
+        
+        if DEBUG_VERBOSE:
+            self.logger.log("System tray icon object created", _LVL_SYSTEM)
+        
+        # Create context menu for tray icon
+        self.create_tray_menu()
+        
+        # Set initial tooltip
+        self.tray_icon.setToolTip('Multiclient (Debug Mode) - Right-click for options')
+        if DEBUG_VERBOSE:
+            self.logger.log("Tray icon tooltip configured", _LVL_SYSTEM)
             
     def create_tray_menu(self):
         """Create the system tray context menu."""
-        self.logger.log("Creating system tray context menu", "SYSTEM")
-        
-        try:
-            self.tray_menu = QMenu()
-            
-            # === DEBUG WINDOW OPTIONS ===
-            self.logger.log("Adding debug window menu options", "SYSTEM")
-            
-            # Show log window option
-            show_log_action = QAction('📋 Show Log Window', self.tray_menu)
-            show_log_action.setToolTip("Open the debug log window")
-            show_log_action.triggered.connect(lambda: self.show_debug_window('log'))
-            self.tray_menu.addAction(show_log_action)
-            
-            # Show control window option
-            show_control_action = QAction('⚙️ Show Control Panel', self.tray_menu)
-            show_control_action.setToolTip("Open the application control panel")
-            show_control_action.triggered.connect(lambda: self.show_debug_window('control'))
-            self.tray_menu.addAction(show_control_action)
-            
-            # Separator
-            self.tray_menu.addSeparator()
-            
-            # === QUICK ACTIONS ===
-            self.logger.log("Adding quick action menu options", "SYSTEM")
-            
-            # Generate test logs
-            test_logs_action = QAction('🧪 Generate Test Logs', self.tray_menu)
-            test_logs_action.setToolTip("Generate sample log entries")
-            test_logs_action.triggered.connect(self.generate_quick_test_logs)
-            self.tray_menu.addAction(test_logs_action)
-            
-            # System information
-            sysinfo_action = QAction('ℹ️ System Info', self.tray_menu)
-            sysinfo_action.setToolTip("Show system information")
-            sysinfo_action.triggered.connect(self.show_quick_system_info)
-            self.tray_menu.addAction(sysinfo_action)
-            
-            # Another separator
-            self.tray_menu.addSeparator()
-            
-            # === EXIT OPTION ===
-            self.logger.log("Adding exit menu option", "SYSTEM")
-            
-            exit_action = QAction('❌ Exit Application', self.tray_menu)
-            exit_action.setToolTip("Exit the application completely")
-            exit_action.triggered.connect(self.safe_exit)
-            self.tray_menu.addAction(exit_action)
-            
-            # Assign menu to tray icon
-            self.tray_icon.setContextMenu(self.tray_menu)
-            
-            self.logger.log("System tray context menu created with all options", "SYSTEM")
-            
-        except Exception as e:
-            error_msg = f"Error creating tray menu: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+        if DEBUG_VERBOSE:
+            self.logger.log("Creating system tray context menu", _LVL_SYSTEM)
+        
+        self.tray_menu = QMenu()
+        
+        # Add the actions (bound to methods, not lambdas) and separators
+        menu = self.tray_menu
+        for item in self._MENU_ITEMS:
+            if item is None:
+                menu.addSeparator()
+                continue
+            label, tooltip, handler = item
+            action = QAction(label, menu)
+            action.setToolTip(tooltip)
+            action.triggered.connect(getattr(self, handler))
+            menu.addAction(action)
+            
+        # Assign menu to tray icon
+        self.tray_icon.setContextMenu(self.tray_menu)
+        
+        # Resolve style, fonts (including the emoji fallback font) and layout
+        # now, so the first right-click doesn't pay for it
+        self.tray_menu.ensurePolished()
+        self.tray_menu.sizeHint()
+        
+        if DEBUG_VERBOSE:
+            self.logger.log("System tray context menu created with all options", _LVL_SYSTEM)
             
     def create_debug_windows(self):
-        """Create the debug interface windows."""
-        self.logger.log("Creating debug interface windows", "SYSTEM")
+        """
+        Prepare the debug interface windows.
         
-        try:
-            # Create log window
-            self.logger.log("Creating debug log window", "SYSTEM")
-            self.log_window = LogWindow(self.logger)
-            
-            # Create control window
-            self.logger.log("Creating control panel window", "SYSTEM")
-            self.control_window = ControlWindow(self.app, self.tray_icon, self.logger)
-            
-            self.logger.log("Debug windows created successfully", "SYSTEM")
-            
-        except Exception as e:
-            error_msg = f"Error creating debug windows: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+        The windows are not built here - each one is created the first time
+        it is requested from the tray (see show_debug_window), so the tray
+        icon appears without waiting for any widget tree construction.
+        """
+        if DEBUG_VERBOSE:
+            self.logger.log("Deferring debug window creation until first use", _LVL_SYSTEM)
             
     def setup_event_handlers(self):
         """Setup event handlers and signal connections."""
-        self.logger.log("Setting up event handlers and signal connections", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Setting up event handlers and signal connections", _LVL_SYSTEM)
         
-        try:
-            # Connect tray icon signals
-            self.tray_icon.activated.connect(self.handle_tray_activation)
-            self.logger.log("Tray icon activation signal connected", "SYSTEM")
-            
-            # Connect application signals
-            self.app.aboutToQuit.connect(self.handle_app_quit)
-            self.logger.log("Application quit signal connected", "SYSTEM")
-            
-            self.logger.log("All event handlers configured successfully", "SYSTEM")
-            
-        except Exception as e:
-            error_msg = f"Error setting up event handlers: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+        # Connect tray icon signals. Qt cannot queue the ActivationReason
+        # type, so the connection is direct and _on_tray_activated defers
+        # the handler to the next event loop pass, outside the shell's
+        # notify callback
+        self.tray_icon.activated.connect(self._on_tray_activated)
+        if DEBUG_VERBOSE:
+            self.logger.log("Tray icon activation signal connected", _LVL_SYSTEM)
+        
+        # Connect application signals (direct - cleanup must run before quit)
+        self.app.aboutToQuit.connect(self.handle_app_quit)
+        if DEBUG_VERBOSE:
+            self.logger.log("Application quit signal connected", _LVL_SYSTEM)
+        
+        if DEBUG_VERBOSE:
+            self.logger.log("All event handlers configured successfully", _LVL_SYSTEM)
             
     def show_interface(self):
         """Display the user interface components."""
-        self.logger.log("Displaying user interface components", "SYSTEM")
+        if DEBUG_VERBOSE:
+            self.logger.log("Displaying user interface components", _LVL_SYSTEM)
         
-        try:
-            # Show debug windows
-            self.log_window.show()
-            self.logger.log("Debug log window displayed", "SYSTEM")
-            
-            self.control_window.show()
-            self.logger.log("Control panel window displayed", "SYSTEM")
+        # Show and activate tray icon (debug windows open from its menu)
+        self.tray_icon.show()
+        if DEBUG_VERBOSE:
+            self.logger.log("System tray icon displayed and activated", _LVL_SYSTEM)
             
-            # Show and activate tray icon
-            self.tray_icon.show()
-            self.logger.log("System tray icon displayed and activated", "SYSTEM")
-            
-            # Position windows nicely
-            self.position_windows()
+    def _screen_geometry(self):
+        """
+        Get the primary screen geometry, querying the screen only once.
+        
+        Returns:
+            QRect: Geometry of the primary screen
+        """
+        if self._screen_geom is None:
+            self._screen_geom = self.app.primaryScreen().geometry()
+        return self._screen_geom
+        
+    def _position_log_window(self):
+        """Position the log window on the left of the screen."""
+        try:
+            # Called before the first show(), so the window maps at this size
+            self.log_window.setGeometry(QRect(50, 50, 900, 700))
             
         except Exception as e:
-            error_msg = f"Error showing interface: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
-            raise
+            error_msg = f"Error positioning log window: {str(e)}"
+            self.logger.log(error_msg, _LVL_WARNING)  # Non-critical error
             
-    def position_windows(self):
-        """Position debug windows in a nice arrangement."""
-        self.logger.log("Positioning debug windows", "SYSTEM")
-        
+    def _position_control_window(self):
+        """Position the control window to the right of the log window."""
         try:
-            # Get screen geometry
-            screen = self.app.primaryScreen().geometry()
-            screen_width = screen.width()
-            screen_height = screen.height()
-            
-            # Position log window on the left
-            log_width = 900
-            log_height = 700
-            log_x = 50
-            log_y = 50
-            self.log_window.setGeometry(log_x, log_y, log_width, log_height)
-            
-            # Position control window on the right
+            # Place it beside the log window (x 50, width 900, 20px gap)
             control_width = 500
             control_height = 600
-            control_x = log_x + log_width + 20
+            control_x = 50 + 900 + 20
             control_y = 50
             
             # Ensure control window fits on screen
+            screen_width = self._screen_geometry().width()
             if control_x + control_width > screen_width:
                 control_x = screen_width - control_width - 50
                 
-            self.control_window.setGeometry(control_x, control_y, control_width, control_height)
-            
-            self.logger.log("Debug windows positioned successfully", "SYSTEM")
+            self.control_window.setGeometry(QRect(control_x, control_y, control_width, control_height))
             
         except Exception as e:
-            error_msg = f"Error positioning windows: {str(e)}"
-            self.logger.log(error_msg, "WARNING")  # Non-critical error
+            error_msg = f"Error positioning control window: {str(e)}"
+            self.logger.log(error_msg, _LVL_WARNING)  # Non-critical error
             
     def show_debug_window(self, window_type):
         """
@@ -1339,158 +2196,162 @@ class MulticlientDebug:
         Args:
             window_type (str): Type of window to show ('log' or 'control')
         """
-        self.logger.log(f"Debug window display requested: {window_type}", "ACTION")
+        self.logger.log(f"Debug window display requested: {window_type}", _LVL_ACTION)
         
         try:
             if window_type == 'log':
+                # Build the window on first request
+                if self.log_window is None:
+                    self.logger.log("Creating debug log window", _LVL_SYSTEM)
+                    self.log_window = LogWindow(self.logger)
+                    self._position_log_window()
+                    
                 self.log_window.show()
                 self.log_window.raise_()
                 self.log_window.activateWindow()
-                self.logger.log("Log window displayed and activated", "ACTION")
+                self.logger.log("Log window displayed and activated", _LVL_ACTION)
                 
             elif window_type == 'control':
+                # Build the window on first request
+                if self.control_window is None:
+                    self.logger.log("Creating control panel window", _LVL_SYSTEM)
+                    self.control_window = ControlWindow(self.app, self.tray_icon, self.logger,
+                                                        self.tray_interaction_count,
+                                                        self._prefetch.result())
+                    self._position_control_window()
+                    
                 self.control_window.show()
                 self.control_window.raise_()
                 self.control_window.activateWindow()
-                self.logger.log("Control window displayed and activated", "ACTION")
+                self.logger.log("Control window displayed and activated", _LVL_ACTION)
                 
             else:
-                self.logger.log(f"Unknown window type requested: {window_type}", "WARNING")
+                self.logger.log(f"Unknown window type requested: {window_type}", _LVL_WARNING)
                 
         except Exception as e:
             error_msg = f"Error showing debug window '{window_type}': {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             
-    def handle_tray_activation(self, reason):
+    def _show_log(self):
+        """Show the debug log window (tray menu action)."""
+        self.show_debug_window('log')
+        
+    def _show_control(self):
+        """Show the control panel window (tray menu action)."""
+        self.show_debug_window('control')
+        
+    def _on_tray_activated(self, reason):
         """
-        Handle system tray icon activation events.
+        Schedule handle_tray_activation for the next event loop pass.
         
         Args:
             reason (QSystemTrayIcon.ActivationReason): The activation reason
         """
-        # Map activation reasons to readable strings
-        activation_reasons = {
-            QSystemTrayIcon.Trigger: "Single Left Click",
-            QSystemTrayIcon.DoubleClick: "Double Left Click", 
-            QSystemTrayIcon.MiddleClick: "Middle Click",
-            QSystemTrayIcon.Context: "Right Click (Context Menu)"
-        }
+        QTimer.singleShot(0, partial(self.handle_tray_activation, int(reason)))
+        
+    def handle_tray_activation(self, reason):
+        """
+        Handle system tray icon activation events.
         
-        reason_str = activation_reasons.get(reason, f"Unknown Activation ({reason})")
-        self.logger.log(f"Tray icon activated: {reason_str}", "EVENT")
+        Args:
+            reason (int): The activation reason (QSystemTrayIcon.ActivationReason)
+        """
+        reason_str = self._ACTIVATION_REASONS.get(reason)
+        if reason_str is None:
+            reason_str = f"Unknown Activation ({reason})"
+        self.logger.log(f"Tray icon activated: {reason_str}", _LVL_EVENT)
         
-        # Update interaction counter in control window
-        if hasattr(self, 'control_window'):
+        # Update interaction counter (and the control window's copy)
+        self.tray_interaction_count += 1
+        if self.control_window is not None:
             self.control_window.increment_tray_interactions()
             
         # Handle double-click to show control panel
         if reason == QSystemTrayIcon.DoubleClick:
-            self.logger.log("Double-click detected - showing control panel", "EVENT")
+            self.logger.log("Double-click detected - showing control panel", _LVL_EVENT)
             self.show_debug_window('control')
             
     def generate_quick_test_logs(self):
         """Generate test logs from tray menu."""
-        self.logger.log("Quick test log generation requested from tray menu", "ACTION")
+        self.logger.log("Quick test log generation requested from tray menu", _LVL_ACTION)
         
-        # Generate a few quick test messages
-        test_messages = [
-            "Quick test: Application status check",
-            "Quick test: Memory usage verification", 
-            "Quick test: Network connectivity check",
-            "Quick test: File system access verification"
-        ]
-        
-        for i, message in enumerate(test_messages, 1):
-            level = ["INFO", "ACTION", "EVENT", "SYSTEM"][i % 4]
-            self.logger.log(f"{message} ({i}/4)", level)
-            
-        self.logger.log("Quick test log generation completed", "ACTION")
+        # Generate a few quick test messages in one batch
+        self.logger.log_many(_QUICK_TEST_MESSAGES)
         
     def show_quick_system_info(self):
         """Show quick system information from tray menu."""
-        self.logger.log("Quick system information requested from tray menu", "ACTION")
+        self.logger.log("Quick system information requested from tray menu", _LVL_ACTION)
         
         try:
-            uptime = self.control_window.get_uptime_string() if hasattr(self, 'control_window') else "Unknown"
-            
-            info_msg = f"""Multiclient Debug - Quick Info
-            
-🕐 Uptime: {uptime}
-🖥️ Platform: {sys.platform}
-🐍 Python: {sys.version.split()[0]}
-💾 Process ID: {os.getpid()}
-📍 Status: Running
-
-Right-click tray icon for more options."""
+            uptime = _APP_UPTIME.text()
             
-            # Create a simple message box
-            msg_box = QMessageBox()
-            msg_box.setWindowTitle("Quick System Info")
-            msg_box.setText(info_msg)
-            msg_box.setIcon(QMessageBox.Information)
+            info_msg = self._sysinfo_template.format(uptime, *self._static_sysinfo)
             
-            # Apply dark theme if possible
-            if hasattr(self, 'control_window'):
-                msg_box.setStyleSheet(self.control_window.styleSheet())
+            # Create a simple message box once, then only update its text
+            if self._info_box is None:
+                self._info_box = QMessageBox()
+                self._info_box.setWindowTitle("Quick System Info")
+                self._info_box.setIcon(QMessageBox.Information)
+                self._info_box.setStyleSheet(CONTROL_WINDOW_STYLESHEET)
                 
-            msg_box.exec_()
+            self._info_box.setText(info_msg)
+            self._info_box.exec_()
             
-            self.logger.log("Quick system information displayed", "ACTION")
+            self.logger.log("Quick system information displayed", _LVL_ACTION)
             
         except Exception as e:
             error_msg = f"Error showing quick system info: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             
     def safe_exit(self):
         """Safely exit the application with confirmation."""
-        self.logger.log("Safe exit requested from tray menu", "ACTION")
+        self.logger.log("Safe exit requested from tray menu", _LVL_ACTION)
         
         try:
-            # Show confirmation dialog
-            msg_box = QMessageBox()
-            msg_box.setWindowTitle("Exit Confirmation")
-            msg_box.setText("Are you sure you want to exit Multiclient Debug?")
-            msg_box.setInformativeText("This will close all debug windows and terminate the application.")
-            msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            msg_box.setDefaultButton(QMessageBox.No)
-            msg_box.setIcon(QMessageBox.Question)
-            
-            # Apply dark theme if available
-            if hasattr(self, 'control_window'):
-                msg_box.setStyleSheet(self.control_window.styleSheet())
+            # Show confirmation dialog (its content never changes, so build it once)
+            if self._exit_box is None:
+                self._exit_box = QMessageBox()
+                self._exit_box.setWindowTitle("Exit Confirmation")
+                self._exit_box.setText("Are you sure you want to exit Multiclient Debug?")
+                self._exit_box.setInformativeText("This will close all debug windows and terminate the application.")
+                self._exit_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+                self._exit_box.setIcon(QMessageBox.Question)
+                self._exit_box.setStyleSheet(CONTROL_WINDOW_STYLESHEET)
                 
-            reply = msg_box.exec_()
+            # Reset the default each time so Enter still means "No"
+            self._exit_box.setDefaultButton(QMessageBox.No)
+            reply = self._exit_box.exec_()
             
             if reply == QMessageBox.Yes:
-                self.logger.log("Exit confirmed by user - initiating shutdown", "ACTION")
+                self.logger.log("Exit confirmed by user - initiating shutdown", _LVL_ACTION)
                 self.handle_app_quit()
                 self.app.quit()
             else:
-                self.logger.log("Exit cancelled by user", "ACTION")
+                self.logger.log("Exit cancelled by user", _LVL_ACTION)
                 
         except Exception as e:
             error_msg = f"Error during safe exit: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             
     def handle_app_quit(self):
         """Handle application quit event."""
-        self.logger.log("Application quit event received - performing cleanup", "SYSTEM")
+        self.logger.log("Application quit event received - performing cleanup", _LVL_SYSTEM)
         
         try:
             # Cleanup control window
-            if hasattr(self, 'control_window'):
+            if self.control_window is not None:
                 self.control_window.cleanup_before_exit()
                 
             # Hide tray icon
-            if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
+            if self.tray_icon is not None and self.tray_icon.isVisible():
                 self.tray_icon.hide()
-                self.logger.log("System tray icon hidden", "SYSTEM")
+                self.logger.log("System tray icon hidden", _LVL_SYSTEM)
                 
-            self.logger.log("=== APPLICATION SHUTDOWN COMPLETED ===", "SYSTEM")
+            self.logger.log("=== APPLICATION SHUTDOWN COMPLETED ===", _LVL_SYSTEM)
             
         except Exception as e:
             error_msg = f"Error during application cleanup: {str(e)}"
-            self.logger.log(error_msg, "ERROR")
+            self.logger.log(error_msg, _LVL_ERROR)
             
     def run(self):
         """
@@ -1499,19 +2360,13 @@ Right-click tray icon for more options."""
         Returns:
             int: Application exit code
         """
-        try:
-            self.logger.log("Starting Qt application main event loop", "SYSTEM")
-            
-            # Start the Qt event loop
-            exit_code = self.app.exec_()
-            
-            self.logger.log(f"Application event loop exited with code: {exit_code}", "SYSTEM")
-            return exit_code
-            
-        except Exception as e:
-            error_msg = f"CRITICAL ERROR in main event loop: {str(e)}\n{traceback.format_exc()}"
-            self.logger.log(error_msg, "ERROR")
-            return 1
+        self.logger.log("Starting Qt application main event loop", _LVL_SYSTEM)
+        
+        # Start the Qt event loop (errors propagate to the __main__ handler)
+        exit_code = self.app.exec_()
+        
+        self.logger.log(f"Application event loop exited with code: {exit_code}", _LVL_SYSTEM)
+        return exit_code
 
 
 # =============================================================================
@@ -1539,6 +2394,6 @@ if __name__ == "__main__":
         sys.exit(0)
         
     except Exception as e:
-        print(f"CRITICAL ERROR: Application failed to start: {str(e)}")
+        print(f"CRITICAL ERROR: Application failed: {str(e)}")
         print(f"Traceback: {traceback.format_exc()}")
         sys.exit(1)
\ No newline at end of file